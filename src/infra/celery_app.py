@@ -1,7 +1,14 @@
+import logging
+from typing import Any
+
 from celery import Celery
+from celery.signals import worker_process_init
 
 from src.config import get_settings
 from src.constants import TTL
+from src.infra.redis import get_redis
+
+logger = logging.getLogger(__name__)
 
 settings = get_settings()
 
@@ -21,3 +28,12 @@ celery_app.conf.update(
     imports=["src.infra.workers.translate_job"],
     worker_prefetch_multiplier=1,
 )
+
+
+@worker_process_init.connect
+def _warm_up_redis(**_: Any) -> None:
+    """fork된 워커 프로세스마다 Redis 연결을 미리 맺어 첫 태스크의 연결 비용 제거"""
+    try:
+        get_redis().ping()  # pyright: ignore[reportUnknownMemberType]
+    except Exception as e:
+        logger.warning(f"Redis 연결 예열 실패: {e}")
@@ -1,4 +1,10 @@
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from typing import Any
+
 import redis
+from redis.commands.core import Script
+from redis.typing import EncodableT
 
 from src.config import get_settings
 
@@ -14,6 +20,8 @@ def get_redis() -> redis.Redis:
             host=settings.redis_host,
             port=settings.redis_port,
             decode_responses=True,
+            socket_keepalive=True,
+            health_check_interval=30,
         )
     return _RedisHolder.client
 
@@ -26,3 +34,42 @@ def close_redis() -> None:
 
 def set_redis(client: redis.Redis | None) -> None:
     _RedisHolder.client = client
+
+
+@lru_cache
+def _register_script(script: str) -> Script:
+    return Script(get_redis(), script)
+
+
+def run_script(script: str, keys: Sequence[str], args: Sequence[EncodableT]) -> Any:
+    """Lua 스크립트를 EVALSHA로 실행 (스크립트 본문은 서버에 없을 때만 SCRIPT LOAD로 전송)
+
+    SHA는 스크립트별로 1회 계산. 실행은 항상 현재 클라이언트로 한다 (set_redis 교체 대응).
+    """
+    return _register_script(script)(keys=keys, args=args, client=get_redis())
+
+
+# JSON 문자열 값의 최상위 필드 갱신 (GET → 수정 → SET KEEPTTL). 키가 없으면 0
+# KEYS[1]: 대상 키, ARGV: field1, value1, field2, value2, ...
+_UPDATE_JSON_FIELDS_SCRIPT = """
+local data = redis.call("GET", KEYS[1])
+if not data then
+    return 0
+end
+local metadata = cjson.decode(data)
+for i = 1, #ARGV, 2 do
+    metadata[ARGV[i]] = ARGV[i + 1]
+end
+redis.call("SET", KEYS[1], cjson.encode(metadata), "KEEPTTL")
+return 1
+"""
+
+
+def update_json_fields(key: str, fields: Mapping[str, str]) -> bool:
+    """JSON 메타데이터의 필드를 TTL 유지한 채 한 번의 왕복으로 갱신
+
+    Returns:
+        키가 존재하여 갱신했으면 True
+    """
+    args = [item for pair in fields.items() for item in pair]
+    return bool(run_script(_UPDATE_JSON_FIELDS_SCRIPT, [key], args))
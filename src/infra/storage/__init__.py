@@ -1,3 +1,4 @@
+from functools import cache
 from pathlib import Path
 
 from .base import StorageBackend
@@ -6,6 +7,7 @@ from .local import LocalStorage
 __all__ = ["StorageBackend", "LocalStorage", "get_storage", "set_storage"]
 
 
+@cache
 def _find_project_root() -> Path:
     """pyproject.toml 위치를 프로젝트 루트로 탐색"""
     current = Path(__file__).resolve().parent
@@ -1,11 +1,13 @@
-import uuid
-from io import BytesIO
+import asyncio
+import secrets
 from pathlib import Path
+from typing import BinaryIO
 
 from fastapi import HTTPException, UploadFile
 from PIL import Image
 
-ALLOWED_TYPES = {"image/jpeg", "image/png"}
+ALLOWED_TYPES = frozenset({"image/jpeg", "image/png"})
+EXT_BY_TYPE = {"image/jpeg": ".jpg", "image/png": ".png"}
 MAX_SIZE = 5 * 1024 * 1024  # 5MB
 CHUNK_SIZE = 1024 * 1024  # 1MB
 
@@ -24,6 +26,8 @@ class LocalStorage:
     def __init__(self, base_dir: Path, base_url: str = "/static"):
         self.base_dir = base_dir
         self.base_url = base_url
+        # 이미 만든 하위 디렉토리 (업로드마다 mkdir/stat 시스템 콜을 반복하지 않음)
+        self._ensured_dirs: set[Path] = set()
 
     async def save(
         self, file: UploadFile, subdir: str = "original", filename: str | None = None
@@ -35,19 +39,25 @@ class LocalStorage:
         self._validate_content_type(file.content_type)
         self._validate_size_header(file.size)
 
-        content = await self._read_with_size_limit(file)
-        detected_type = self._detect_image_type(content)
-        self._validate_content_type_match(detected_type, file.content_type)
-        self._validate_image_dimensions(content)
-
-        name = filename or uuid.uuid4().hex
-        ext = Path(file.filename or "").suffix or ".jpg"
+        name = filename or secrets.token_hex(16)
+        # 클라이언트 파일명이 아니라 검증된 content-type으로 확장자 결정
+        ext = EXT_BY_TYPE.get(file.content_type or "", ".jpg")
 
         relative_path = f"{subdir}/{name}{ext}"
         save_path = self.base_dir / relative_path
-        save_path.parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(save_path.parent)
+
+        # 임시 파일로 스트리밍 후 검증 통과 시 rename (메모리에 전체 파일을 올리지 않음)
+        tmp_path = save_path.with_name(f"{save_path.name}.part")
+        try:
+            detected_type = await asyncio.to_thread(self._copy_with_size_limit, file.file, tmp_path)
+            self._validate_content_type_match(detected_type, file.content_type)
+            self._validate_image_dimensions(tmp_path)
+            tmp_path.replace(save_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
-        save_path.write_bytes(content)
         return relative_path
 
     def get_url(self, relative_path: str) -> str:
@@ -66,6 +76,11 @@ class LocalStorage:
             return True
         return False
 
+    def _ensure_dir(self, path: Path) -> None:
+        if path not in self._ensured_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(path)
+
     def _validate_content_type(self, content_type: str | None) -> None:
         if not content_type or content_type not in ALLOWED_TYPES:
             raise HTTPException(
@@ -93,10 +108,10 @@ class LocalStorage:
                 detail=f"파일 형식 불일치: 헤더 {declared}, 실제 {detected}",
             )
 
-    def _validate_image_dimensions(self, content: bytes) -> None:
+    def _validate_image_dimensions(self, path: Path) -> None:
         try:
-            img = Image.open(BytesIO(content))
-            width, height = img.size
+            with Image.open(path) as img:
+                width, height = img.size
         except Exception as e:
             raise HTTPException(status_code=400, detail="이미지 디코딩 실패") from e
 
@@ -118,17 +133,29 @@ class LocalStorage:
                 detail=f"세로/가로 비율 초과: {height / width:.2f} (최대 {MAX_ASPECT_RATIO})",
             )
 
-    async def _read_with_size_limit(self, file: UploadFile) -> bytes:
-        chunks: list[bytes] = []
-        total_size = 0
+    def _copy_with_size_limit(self, src: BinaryIO, dest: Path) -> str:
+        """CHUNK_SIZE 단위로 dest에 복사하며 크기 제한 검사. 첫 청크로 이미지 타입 판별.
+
+        워커 스레드 한 번에서 전체 복사를 수행 (청크마다 스레드 왕복하지 않음)
 
-        while chunk := await file.read(CHUNK_SIZE):
-            total_size += len(chunk)
-            if total_size > MAX_SIZE:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"파일 크기 초과: {total_size}+ bytes (최대 {MAX_SIZE} bytes)",
-                )
-            chunks.append(chunk)
+        Returns:
+            magic bytes로 판별한 MIME 타입
+        """
+        detected_type: str | None = None
+        total_size = 0
 
-        return b"".join(chunks)
+        with dest.open("wb") as out:
+            while chunk := src.read(CHUNK_SIZE):
+                if detected_type is None:
+                    detected_type = self._detect_image_type(chunk)
+                total_size += len(chunk)
+                if total_size > MAX_SIZE:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"파일 크기 초과: {total_size}+ bytes (최대 {MAX_SIZE} bytes)",
+                    )
+                out.write(chunk)
+
+        if detected_type is None:  # 빈 파일
+            raise HTTPException(status_code=400, detail="유효하지 않은 이미지 파일")
+        return detected_type
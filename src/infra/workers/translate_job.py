@@ -3,50 +3,61 @@
 Celery 워커에서 실행되는 백그라운드 태스크.
 """
 
-import json
 import logging
-from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any, cast
+from typing import Any
 
+import cv2
 from celery.exceptions import SoftTimeLimitExceeded
+from pydantic_core import from_json
 
 from src.config import get_settings
 from src.constants import RedisPrefix
 from src.infra.celery_app import celery_app
-from src.infra.redis import get_redis
-from src.infra.storage import get_storage
+from src.infra.redis import run_script, update_json_fields
+from src.infra.storage import StorageBackend, get_storage
 from src.services.pipeline import translate_image
+from src.utils import utc_now_iso
 
 logger = logging.getLogger(__name__)
 
+_BASE_URL = get_settings().base_url
+
+
+# 상태를 processing으로 갱신하고 translate → upload 체이닝 조회까지 한 번의 왕복으로 수행
+# KEYS[1]: translate 키, ARGV[1]: upload 키 prefix ("upload:"), ARGV[2]: 상태값
+_START_JOB_SCRIPT = """
+local data = redis.call("GET", KEYS[1])
+if not data then
+    return false
+end
+local metadata = cjson.decode(data)
+metadata["status"] = ARGV[2]
+redis.call("SET", KEYS[1], cjson.encode(metadata), "KEEPTTL")
+local upload_id = metadata["upload_id"]
+if type(upload_id) ~= "string" or upload_id == "" then
+    return false
+end
+return redis.call("GET", ARGV[1] .. upload_id)
+"""
 
-def _get_image_path(translate_id: str) -> str | None:
-    """translate_id → upload_id → 파일 경로 체이닝 조회"""
-    redis = get_redis()
-
-    translate_data = redis.get(f"{RedisPrefix.TRANSLATE}:{translate_id}")
-    if not translate_data:
-        return None
-
-    metadata = json.loads(cast(str, translate_data))
-    upload_id = metadata.get("upload_id")
-    if not upload_id:
-        return None
 
-    upload_data = redis.get(f"{RedisPrefix.UPLOAD}:{upload_id}")
+def _start_job(translate_id: str, storage: StorageBackend) -> str | None:
+    """상태를 processing으로 갱신 후 translate_id → upload_id → 파일 경로 체이닝 조회"""
+    upload_data: str | None = run_script(
+        _START_JOB_SCRIPT,
+        [f"{RedisPrefix.TRANSLATE}:{translate_id}"],
+        [f"{RedisPrefix.UPLOAD}:", "processing"],
+    )
     if not upload_data:
         return None
 
-    upload = json.loads(cast(str, upload_data))
+    upload = from_json(upload_data)
     relative_path = upload.get("path")
     if not relative_path:
         return None
 
-    storage = get_storage()
-    if not storage.exists(relative_path):
-        return None
-
+    # 파일 부재는 파이프라인의 이미지 로드 단계에서 실패로 처리됨
     return storage.get_absolute_path(relative_path)
 
 
@@ -57,29 +68,22 @@ def _update_status(
     error_message: str | None = None,
 ) -> None:
     """Redis에 번역 작업 상태 업데이트 (FE 폴링용)"""
-    redis = get_redis()
-    key = f"{RedisPrefix.TRANSLATE}:{translate_id}"
-
-    data = redis.get(key)
-    if not data:
-        return
-
-    metadata = json.loads(cast(str, data))
-    metadata["status"] = status
+    fields: dict[str, str] = {"status": status}
 
     if result_url:
-        metadata["result_url"] = result_url
+        fields["result_url"] = result_url
 
     if error_message:
-        metadata["error_message"] = error_message
+        fields["error_message"] = error_message
 
     if status == "completed":
-        metadata["completed_at"] = datetime.now(UTC).isoformat().replace("+00:00", "Z")
+        fields["completed_at"] = utc_now_iso()
 
-    redis.set(key, json.dumps(metadata), keepttl=True)
+    update_json_fields(f"{RedisPrefix.TRANSLATE}:{translate_id}", fields)
 
 
-@celery_app.task(soft_time_limit=300, time_limit=360)
+# 상태는 Redis translate 키로 폴링하므로 Celery result backend 기록은 생략
+@celery_app.task(soft_time_limit=300, time_limit=360, ignore_result=True)
 def translate_job(translate_id: str) -> dict[str, Any]:
     """번역 작업 태스크
 
@@ -92,23 +96,21 @@ def translate_job(translate_id: str) -> dict[str, Any]:
     logger.info(f"[{translate_id}] 번역 시작")
 
     try:
-        _update_status(translate_id, "processing")
-
-        image_path = _get_image_path(translate_id)
+        storage = get_storage()
+        image_path = _start_job(translate_id, storage)
         if not image_path:
             _update_status(translate_id, "failed", error_message="이미지를 찾을 수 없음")
             return {"status": "failed", "error": "이미지를 찾을 수 없음"}
 
         result_image = translate_image(image_path)
 
-        storage = get_storage()
         result_relative = f"result/{translate_id}_result.png"
         result_abs_path = Path(storage.get_absolute_path(result_relative))
         result_abs_path.parent.mkdir(parents=True, exist_ok=True)
-        result_image.save(str(result_abs_path))
+        if not cv2.imwrite(str(result_abs_path), result_image):
+            raise RuntimeError(f"결과 이미지 저장 실패: {result_relative}")
 
-        settings = get_settings()
-        result_url = f"{settings.base_url}/static/{result_relative}"
+        result_url = f"{_BASE_URL}/static/{result_relative}"
         _update_status(translate_id, "completed", result_url=result_url)
 
         logger.info(f"[{translate_id}] 번역 완료: {result_relative}")
@@ -15,7 +15,7 @@ from fastapi import APIRouter, HTTPException, Request, status
 
 from src.infra.workers.translate_job import translate_job
 from src.services import translate as translate_service
-from src.services.quota import QuotaExceededError, check_and_consume_quota, hash_ip, refund_quota
+from src.services.quota import QuotaExceededError, hash_ip, refund_quota
 
 router = APIRouter(prefix="/translate", tags=["translate"])
 logger = logging.getLogger(__name__)
@@ -61,22 +61,15 @@ async def create_translate(
         ) from None
 
     try:
-        await check_and_consume_quota(hashed_ip, 1)
+        response = await translate_service.create_translate(
+            request, original_url, hashed_ip=hashed_ip
+        )
     except QuotaExceededError:
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             detail={"code": "RATE_LIMIT_EXCEEDED", "message": "주간 사용량 한도를 초과했습니다"},
         ) from None
 
-    try:
-        response = await translate_service.create_translate(request, original_url)
-    except Exception:
-        try:
-            await refund_quota(hashed_ip, 1)
-        except Exception:
-            logger.error("쿼터 환급 실패")
-        raise
-
     try:
         await asyncio.to_thread(translate_job.delay, response.translate_id)
     except Exception as e:
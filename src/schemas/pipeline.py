@@ -59,7 +59,7 @@ class BBox(BaseModel):
         return cls(x1=coords[0], y1=coords[1], x2=coords[2], y2=coords[3])
 
     def to_tuple(self) -> tuple[int, int, int, int]:
-        """정수 튜플로 변환 (PIL crop 등에 사용)
+        """정수 튜플로 변환 (PIL crop, numpy 슬라이싱 등에 사용)
 
         round()를 사용하여 반올림 (truncation 방지)
         """
@@ -7,9 +7,7 @@ TODO: 스키마(Request/Response/Metadata)를 src/schemas/로 분리 검토.
       translate.py도 동일 구조이므로 함께 정리.
 """
 
-import json
-import uuid
-from datetime import UTC, datetime
+import secrets
 from typing import Literal, cast
 
 from pydantic import BaseModel, field_validator
@@ -23,6 +21,7 @@ from src.services.translate import (
     create_translate,
     get_translate,
 )
+from src.utils import utc_now_iso
 
 BatchStatus = Literal["processing", "completed", "partial_failure", "failed"]
 
@@ -70,7 +69,7 @@ class BatchResponse(BaseSchema):
 
 
 def _generate_batch_id() -> str:
-    return f"{BatchId.PREFIX}{uuid.uuid4().hex[:8]}"
+    return f"{BatchId.PREFIX}{secrets.token_hex(4)}"
 
 
 def _compute_batch_status(images: list[BatchImageEntry]) -> BatchStatus:
@@ -95,7 +94,7 @@ async def create_batch(request: BatchRequest, original_urls: list[str]) -> Batch
 
     redis = get_redis()
     batch_id = _generate_batch_id()
-    created_at = datetime.now(UTC).isoformat().replace("+00:00", "Z")
+    created_at = utc_now_iso()
     images: list[BatchImageEntry] = []
 
     pairs = zip(request.upload_ids, original_urls, strict=True)
@@ -149,7 +148,7 @@ async def get_batch(batch_id: str) -> BatchResponse | None:
     if data is None:
         return None
 
-    metadata = BatchMetadata.model_validate(json.loads(cast(str, data)))
+    metadata = BatchMetadata.model_validate_json(cast(str, data))
 
     updated_images: list[BatchImageEntry] = []
     for image in metadata.images:
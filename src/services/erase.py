@@ -15,13 +15,13 @@ TODO: 말풍선(흰색 배경) 텍스트는 LaMa보다 단순 흰색 채우기
 
 import base64
 import io
-import json
 import logging
 from typing import cast
 
 import cv2
 import numpy as np
 from PIL import Image
+from pydantic_core import from_json
 
 from src.constants import RedisPrefix, TranslateId
 from src.infra.redis import get_redis
@@ -89,11 +89,15 @@ def _b64_to_numpy(b64_str: str) -> np.ndarray:
 
 
 def _numpy_to_b64(arr: np.ndarray) -> str:
-    """numpy 배열 → base64 PNG"""
-    img = Image.fromarray(arr)
-    buffer = io.BytesIO()
-    img.save(buffer, format="PNG")
-    return base64.b64encode(buffer.getvalue()).decode()
+    """numpy 배열(RGB) → base64 PNG
+
+    cv2 PNG 인코딩(기본 압축 1)이 PIL 기본값(압축 6)보다 수 배 빠름
+    """
+    bgr = cv2.cvtColor(arr, cv2.COLOR_RGB2BGR) if arr.ndim == 3 else arr
+    ok, buffer = cv2.imencode(".png", bgr)
+    if not ok:
+        raise EraseError("INPAINTING_FAILED", "결과 이미지 인코딩 실패")
+    return base64.b64encode(buffer.tobytes()).decode()
 
 
 def _validate_translate_id(translate_id: str) -> None:
@@ -122,8 +126,8 @@ def _get_result_image_path(translate_id: str) -> str:
         raise EraseError("TRANSLATE_NOT_FOUND", f"번역을 찾을 수 없습니다: {translate_id}")
 
     try:
-        metadata = json.loads(cast(str, translate_data))
-    except (json.JSONDecodeError, TypeError, UnicodeDecodeError) as e:
+        metadata = from_json(cast(str, translate_data))
+    except (ValueError, TypeError) as e:
         logger.error(f"Redis 데이터 파싱 실패: {translate_id} - {e}")
         raise EraseError("INPAINTING_FAILED", "번역 메타데이터 파싱 실패") from e
 
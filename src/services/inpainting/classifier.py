@@ -1,7 +1,7 @@
 """텍스트 영역 분류기: 말풍선 vs 자유 텍스트"""
 
 from src.schemas.pipeline import BBox, TextRegion
-from src.services.inpainting.utils import find_bubble
+from src.services.inpainting.utils import find_bubbles
 
 
 class RegionClassifier:
@@ -18,8 +18,8 @@ class RegionClassifier:
         bubble_regions: list[TextRegion] = []
         free_regions: list[TextRegion] = []
 
-        for region in text_regions:
-            bubble = find_bubble(region.text_bbox, bubble_bboxes)
+        bubbles = find_bubbles([r.text_bbox for r in text_regions], bubble_bboxes)
+        for region, bubble in zip(text_regions, bubbles, strict=True):
             if bubble:
                 bubble_regions.append(
                     TextRegion(
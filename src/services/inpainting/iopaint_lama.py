@@ -16,7 +16,7 @@ from src.services.inpainting.utils import (
     clip_to_bounds,
     convert_to_bgr,
     create_mask,
-    find_bubble,
+    find_bubbles,
     save_debug_images,
 )
 
@@ -52,8 +52,8 @@ class IOPaintLamaInpainting:
 
         updated_regions: list[TextRegion] = []
 
-        for region in text_regions:
-            bubble = find_bubble(region.text_bbox, bubble_bboxes)
+        bubbles = find_bubbles([r.text_bbox for r in text_regions], bubble_bboxes)
+        for region, bubble in zip(text_regions, bubbles, strict=True):
             inpaint_bbox = self._calc_inpaint_bbox(region.text_bbox, (w, h))
             render_bbox = calc_render_bbox(bubble, inpaint_bbox)
 
@@ -8,7 +8,7 @@ from src.services.inpainting.utils import (
     INSCRIBED_RATIO,
     calc_render_bbox,
     clip_to_bounds,
-    find_bubble,
+    find_bubbles,
     inscribed_rect,
 )
 
@@ -36,8 +36,8 @@ class SolidFillInpainting:
         result = image.copy()
         updated_regions: list[TextRegion] = []
 
-        for region in text_regions:
-            bubble = find_bubble(region.text_bbox, bubble_bboxes)
+        bubbles = find_bubbles([r.text_bbox for r in text_regions], bubble_bboxes)
+        for region, bubble in zip(text_regions, bubbles, strict=True):
             inpaint_bbox = self._calc_inpaint_bbox(region.text_bbox, bubble, (w, h))
             render_bbox = calc_render_bbox(bubble, inpaint_bbox)
 
@@ -29,6 +29,24 @@ def calc_overlap_ratio(box_a: BBox, box_b: BBox) -> float:
     return (ix2 - ix1) * (iy2 - iy1) / area_a
 
 
+def calc_overlap_ratio_batch(boxes_a: np.ndarray, boxes_b: np.ndarray) -> np.ndarray:
+    """(N, 4) x (K, 4) 박스 쌍의 겹침 비율 행렬 (N, K) 계산 (boxes_a 면적 기준)
+
+    calc_overlap_ratio와 같은 규칙: 면적 0인 box_a 행은 모두 0.
+    """
+    a = np.asarray(boxes_a, dtype=np.float64).reshape(-1, 4)
+    b = np.asarray(boxes_b, dtype=np.float64).reshape(-1, 4)
+
+    tl = np.maximum(a[:, None, :2], b[None, :, :2])
+    br = np.minimum(a[:, None, 2:], b[None, :, 2:])
+    inter = np.prod(np.clip(br - tl, 0, None), axis=2)
+
+    area_a = np.prod(a[:, 2:] - a[:, :2], axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = inter / area_a[:, None]
+    return np.where(area_a[:, None] > 0, ratio, 0.0)
+
+
 def clip_to_bounds(bbox: BBox, width: int, height: int) -> BBox:
     """박스를 이미지 경계 [0, width] x [0, height] 내로 클리핑
 
@@ -61,6 +79,30 @@ def find_bubble(text_bbox: BBox, bubbles: list[BBox]) -> BBox | None:
     return best if best_overlap > OVERLAP_THRESHOLD else None
 
 
+def find_bubbles(text_bboxes: list[BBox], bubbles: list[BBox]) -> list[BBox | None]:
+    """텍스트별 find_bubble 결과를 한 번의 (N, K) 행렬 연산으로 계산
+
+    bubble 배열은 페이지당 1회만 만들고, 동점이면 find_bubble처럼 앞쪽 bubble을 고른다.
+    """
+    if not bubbles:
+        return [None] * len(text_bboxes)
+    if not text_bboxes:
+        return []
+
+    ratios = calc_overlap_ratio_batch(_to_array(text_bboxes), _to_array(bubbles))
+    best = ratios.argmax(axis=1)
+    best_ratio = ratios[np.arange(len(text_bboxes)), best]
+
+    return [
+        bubbles[k] if r > OVERLAP_THRESHOLD else None
+        for k, r in zip(best.tolist(), best_ratio.tolist(), strict=True)
+    ]
+
+
+def _to_array(boxes: list[BBox]) -> np.ndarray:
+    return np.array([(b.x1, b.y1, b.x2, b.y2) for b in boxes], dtype=np.float64)
+
+
 def calc_render_bbox(bubble: BBox | None, inpaint_bbox: BBox) -> BBox:
     """렌더링용 안전 영역 계산"""
     if bubble:
@@ -1,19 +1,20 @@
 """멀티 모델 번역 파이프라인
 
-Detection → Inpainting → Translation → Rendering 순서로 실행.
+Detection → Inpainting/Translation(병렬) → Rendering 순서로 실행.
 각 단계는 Protocol 기반 모듈을 팩토리에서 가져옴.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 import cv2
-from PIL import Image
+import numpy as np
 
 from src.schemas.pipeline import BBox, TextRegion
 from src.services.detection import get_detection
 from src.services.detection.schemas import DetectionResult
 from src.services.inpainting import get_inpainting
-from src.services.rendering import render_translations
+from src.services.rendering import render_translations_np
 from src.services.translation import get_translation
 
 logger = logging.getLogger(__name__)
@@ -35,42 +36,51 @@ def build_text_regions(
     return text_regions, bubble_bboxes
 
 
-def translate_image(image_path: str) -> Image.Image:
+def translate_image(image_path: str) -> np.ndarray:
     """이미지를 번역하여 결과 이미지 반환
 
     Args:
         image_path: 원본 이미지 파일 경로
 
     Returns:
-        번역된 이미지 (PIL Image)
+        번역된 이미지 (BGR numpy 배열, cv2.imwrite/imencode로 바로 인코딩 가능)
 
     Raises:
         PipelineError: 이미지 로드 실패 시
     """
+    # 한 번만 디코딩하여 Inpainting/Translation에서 공유 (Detection은 파일을 그대로 업로드)
+    image_bgr = cv2.imread(image_path, cv2.IMREAD_COLOR)
+    if image_bgr is None:
+        raise PipelineError(f"이미지를 읽을 수 없음: {image_path}")
+
     # 1. Detection
     detection = get_detection().detect(image_path)
     text_regions, bubble_bboxes = build_text_regions(detection)
     logger.info(f"Detection 완료: {len(text_regions)}개 텍스트, {len(bubble_bboxes)}개 말풍선")
 
     if not text_regions:
-        with Image.open(image_path) as img:
-            return img.convert("RGB")
+        return image_bgr
 
-    # 2. Inpainting
-    image_bgr = cv2.imread(image_path)
-    if image_bgr is None:
-        raise PipelineError(f"이미지를 읽을 수 없음: {image_path}")
+    # 2~3. Inpainting과 Translation은 서로 독립이므로 병렬 실행 (둘 다 원격 API 대기가 대부분)
+    translator = get_translation()
+    text_bboxes = [r.text_bbox for r in text_regions]
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        translation_future = executor.submit(translator.translate, image_bgr, text_bboxes)
 
-    clean_image, updated_regions = get_inpainting().inpaint(image_bgr, text_regions, bubble_bboxes)
-    logger.info(f"Inpainting 완료: {len(updated_regions)}개 영역")
+        clean_image, updated_regions = get_inpainting().inpaint(
+            image_bgr, text_regions, bubble_bboxes
+        )
+        logger.info(f"Inpainting 완료: {len(updated_regions)}개 영역")
 
-    # 3. Translation
-    text_bboxes = [r.text_bbox for r in text_regions]
-    translations = get_translation().translate(image_path, text_bboxes)
-    logger.info(f"번역 결과: {len(translations)}/{len(text_regions)}개")
+        translations = translation_future.result()
+        logger.info(f"번역 결과: {len(translations)}/{len(text_regions)}개")
+    finally:
+        # 타임아웃 등으로 중단될 때 번역 스레드 종료를 기다리지 않음
+        executor.shutdown(wait=False, cancel_futures=True)
 
     # 4. Rendering
-    result = render_translations(clean_image, updated_regions, translations)
+    result = render_translations_np(clean_image, updated_regions, translations)
     logger.info("Rendering 완료")
 
     return result
@@ -6,19 +6,22 @@ IP 기준, ISO week 단위, 이미지 수로 차감.
 
 import hashlib
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 
 from src.config import get_settings
-from src.constants import Limits, RedisPrefix
-from src.infra.redis import get_redis
+from src.constants import TTL, Limits, RedisPrefix
+from src.infra.redis import run_script
 
 
 class QuotaExceededError(Exception):
     pass
 
 
+@lru_cache(maxsize=4096)
 def hash_ip(ip: str) -> str:
-    secret = get_settings().ip_hash_secret
-    return hashlib.sha256(f"{secret}:{ip}".encode()).hexdigest()[:16]
+    """IP를 16자리 hex로 익명화 (BLAKE2b keyed hash, 8바이트 digest)"""
+    secret = get_settings().ip_hash_secret.encode()[:64]  # BLAKE2b key 최대 64바이트
+    return hashlib.blake2b(ip.encode(), key=secret, digest_size=8).hexdigest()
 
 
 def _get_quota_key(hashed_ip: str) -> str:
@@ -36,6 +39,8 @@ def _seconds_until_next_monday() -> int:
     return max(int((next_monday - now).total_seconds()), 1)
 
 
+# KEYS[1]: 쿼터 키, KEYS[2..]: 쿼터 차감과 함께 저장할 데이터 키
+# ARGV: requested, limit, 쿼터 TTL, 데이터 TTL, 데이터 값...
 _CONSUME_SCRIPT = """
 local current = tonumber(redis.call("GET", KEYS[1]) or "0")
 local requested = tonumber(ARGV[1])
@@ -45,6 +50,9 @@ if current + requested > limit then
 end
 redis.call("INCRBY", KEYS[1], requested)
 redis.call("EXPIRE", KEYS[1], ARGV[3])
+for i = 2, #KEYS do
+    redis.call("SET", KEYS[i], ARGV[i + 3], "EX", ARGV[4])
+end
 return current + requested
 """
 
@@ -60,21 +68,27 @@ return new_val
 """
 
 
-async def check_and_consume_quota(hashed_ip: str, count: int) -> None:
-    """쿼터 차감. 초과 시 QuotaExceededError 발생."""
+async def check_and_consume_quota(
+    hashed_ip: str,
+    count: int,
+    entries: dict[str, str] | None = None,
+    ex: int = TTL.DATA,
+) -> None:
+    """쿼터 차감. 초과 시 QuotaExceededError 발생.
+
+    entries가 주어지면 차감과 같은 Lua 호출에서 각 키를 TTL ex로 저장한다.
+    쿼터 초과 시에는 아무것도 저장하지 않는다.
+    """
     if count <= 0:
         raise ValueError(f"count는 양수여야 합니다: {count}")
-    redis = get_redis()
     key = _get_quota_key(hashed_ip)
     ttl = _seconds_until_next_monday()
+    entries = entries or {}
 
-    result: int = redis.eval(  # type: ignore[assignment]
+    result: int = run_script(
         _CONSUME_SCRIPT,
-        1,
-        key,
-        count,
-        Limits.WEEKLY_IMAGES,
-        ttl,
+        [key, *entries.keys()],
+        [count, Limits.WEEKLY_IMAGES, ttl, ex, *entries.values()],
     )
 
     if result == -1:
@@ -85,12 +99,6 @@ async def refund_quota(hashed_ip: str, count: int) -> None:
     """쿼터 환급 (큐잉 실패 시). 0 이하로 내려가지 않는다."""
     if count <= 0:
         raise ValueError(f"count는 양수여야 합니다: {count}")
-    redis = get_redis()
     key = _get_quota_key(hashed_ip)
 
-    redis.eval(  # type: ignore[union-attr]
-        _REFUND_SCRIPT,
-        1,
-        key,
-        count,
-    )
+    run_script(_REFUND_SCRIPT, [key], [count])
@@ -2,6 +2,8 @@
 
 import logging
 import textwrap
+import threading
+from collections.abc import Callable
 from functools import lru_cache
 from pathlib import Path
 from typing import cast
@@ -22,11 +24,49 @@ FONT_PATHS = [
     "C:/Windows/Fonts/arial.ttf",
 ]
 
+# ASCII 텍스트는 cv2 Hershey 폰트로 numpy 배열에 직접 렌더링 (FreeType 경로보다 빠름)
+CV2_FONT = cv2.FONT_HERSHEY_DUPLEX
+
+# (text, font_size) → 렌더링 너비(px)
+TextMeasurer = Callable[[str, int], float]
+
 
 class RenderingError(Exception):
     pass
 
 
+class _MeasureDrawHolder(threading.local):
+    """텍스트 측정 전용 Draw (스레드별 1회 생성, 페이지 간 재사용)"""
+
+    draw: ImageDraw.ImageDraw | None = None
+
+
+_measure_holder = _MeasureDrawHolder()
+
+
+def _get_measure_draw() -> ImageDraw.ImageDraw:
+    if _measure_holder.draw is None:
+        _measure_holder.draw = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+    return _measure_holder.draw
+
+
+def _pil_text_width(text: str, font_size: int) -> float:
+    return _get_measure_draw().textbbox((0, 0), text, font=_get_font(font_size))[2]
+
+
+@lru_cache(maxsize=64)
+def _cv2_font_params(font_size: int) -> tuple[float, int]:
+    """font_size(px 높이) → (cv2 fontScale, thickness)"""
+    thickness = max(1, font_size // 16)
+    return cv2.getFontScaleFromHeight(CV2_FONT, font_size, thickness), thickness
+
+
+def _cv2_text_width(text: str, font_size: int) -> float:
+    scale, thickness = _cv2_font_params(font_size)
+    (width, _), _ = cv2.getTextSize(text, CV2_FONT, scale, thickness)
+    return width
+
+
 @lru_cache(maxsize=32)
 def _get_font(size: int) -> ImageFont.FreeTypeFont:
     for font_path in FONT_PATHS:
@@ -38,21 +78,18 @@ def _get_font(size: int) -> ImageFont.FreeTypeFont:
     return cast(ImageFont.FreeTypeFont, ImageFont.load_default())
 
 
-def _fit_text(
-    text: str, width: int, height: int, draw: ImageDraw.ImageDraw
-) -> tuple[ImageFont.FreeTypeFont, list[str]]:
-    """박스에 맞는 최적 폰트와 줄바꿈된 텍스트 반환"""
+def _fit_text(text: str, width: int, height: int, measure: TextMeasurer) -> tuple[int, list[str]]:
+    """박스에 맞는 최적 폰트 크기와 줄바꿈된 텍스트 반환"""
     max_size = min(height // 2, 40)
     min_size = 8
 
     for size in range(max_size, min_size - 1, -1):
-        font = _get_font(size)
-        lines = _wrap_text(text, width, font, draw)
+        lines = _wrap_text(text, width, size, measure)
 
-        if _text_fits(lines, width, height, size, draw, font):
-            return font, lines
+        if _text_fits(lines, width, height, size, measure):
+            return size, lines
 
-    return _get_font(min_size), _force_wrap(text, width, min_size, draw)
+    return min_size, _force_wrap(text, width, min_size, measure)
 
 
 def _calc_chars_per_line(box_width: int, avg_char_width: float) -> int:
@@ -60,12 +97,9 @@ def _calc_chars_per_line(box_width: int, avg_char_width: float) -> int:
     return max(1, int((box_width * 0.8) / avg_char_width))
 
 
-def _wrap_text(
-    text: str, width: int, font: ImageFont.FreeTypeFont, draw: ImageDraw.ImageDraw
-) -> list[str]:
+def _wrap_text(text: str, width: int, font_size: int, measure: TextMeasurer) -> list[str]:
     sample = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
-    bbox = draw.textbbox((0, 0), sample, font=font)
-    avg_char_width = (bbox[2] - bbox[0]) / len(sample)
+    avg_char_width = measure(sample, font_size) / len(sample)
     chars_per_line = _calc_chars_per_line(width, avg_char_width)
     return textwrap.fill(text, width=chars_per_line).split("\n")
 
@@ -76,11 +110,11 @@ def _fits_in_box(text_width: float, text_height: float, box_width: int, box_heig
 
 
 def _measure_text_block(
-    lines: list[str], font_size: int, draw: ImageDraw.ImageDraw, font: ImageFont.FreeTypeFont
+    lines: list[str], font_size: int, measure: TextMeasurer
 ) -> tuple[float, float]:
     """텍스트 블록의 너비와 높이 측정"""
     total_height = len(lines) * font_size * 1.3
-    max_width = max(draw.textbbox((0, 0), line, font=font)[2] for line in lines)
+    max_width = max(measure(line, font_size) for line in lines)
     return max_width, total_height
 
 
@@ -89,22 +123,20 @@ def _text_fits(
     width: int,
     height: int,
     font_size: int,
-    draw: ImageDraw.ImageDraw,
-    font: ImageFont.FreeTypeFont,
+    measure: TextMeasurer,
 ) -> bool:
-    text_width, text_height = _measure_text_block(lines, font_size, draw, font)
+    text_width, text_height = _measure_text_block(lines, font_size, measure)
     return _fits_in_box(text_width, text_height, width, height)
 
 
-def _force_wrap(text: str, width: int, font_size: int, draw: ImageDraw.ImageDraw) -> list[str]:
+def _force_wrap(text: str, width: int, font_size: int, measure: TextMeasurer) -> list[str]:
     """글자 단위 강제 줄바꿈 (fallback)"""
-    font = _get_font(font_size)
     lines: list[str] = []
     current = ""
 
     for char in text:
         test = current + char
-        if draw.textbbox((0, 0), test, font=font)[2] > width * 0.9:
+        if measure(test, font_size) > width * 0.9:
             if current:
                 lines.append(current)
             current = char
@@ -117,6 +149,25 @@ def _force_wrap(text: str, width: int, font_size: int, draw: ImageDraw.ImageDraw
     return lines
 
 
+def _layout_lines(
+    lines: list[str],
+    font_size: int,
+    measure: TextMeasurer,
+    x1: int,
+    y1: int,
+    width: int,
+    height: int,
+) -> list[tuple[str, float, float]]:
+    """각 줄의 (텍스트, x, y) 계산 - 박스 중앙 정렬, (x, y)는 줄의 좌상단"""
+    line_height = font_size * 1.4
+    start_y = y1 + (height - len(lines) * line_height) / 2
+
+    return [
+        (line, x1 + (width - measure(line, font_size)) / 2, start_y + i * line_height)
+        for i, line in enumerate(lines)
+    ]
+
+
 def _render_text_in_box(
     draw: ImageDraw.ImageDraw,
     text: str,
@@ -129,43 +180,80 @@ def _render_text_in_box(
     if width < 10 or height < 10:
         return
 
-    font, lines = _fit_text(text, width, height, draw)
-    font_size = getattr(font, "size", 10)
-    line_height = font_size * 1.4
-    total_height = len(lines) * line_height
+    font_size, lines = _fit_text(text, width, height, _pil_text_width)
+    font = _get_font(font_size)
 
-    start_y = y1 + (height - total_height) / 2
+    for line, x, y in _layout_lines(lines, font_size, _pil_text_width, x1, y1, width, height):
+        draw.text((x, y), line, font=font, fill="black")
 
-    for i, line in enumerate(lines):
-        line_bbox = draw.textbbox((0, 0), line, font=font)
-        line_width = line_bbox[2] - line_bbox[0]
 
-        x = x1 + (width - line_width) / 2
-        y = start_y + i * line_height
+def _render_text_in_box_cv2(
+    image: np.ndarray,
+    text: str,
+    x1: int,
+    y1: int,
+    x2: int,
+    y2: int,
+) -> None:
+    """ASCII 텍스트를 cv2.putText로 image에 직접 렌더링 (in-place)"""
+    width, height = x2 - x1, y2 - y1
+    if width < 10 or height < 10:
+        return
 
-        draw.text((x, y), line, font=font, fill="black")
+    font_size, lines = _fit_text(text, width, height, _cv2_text_width)
+    scale, thickness = _cv2_font_params(font_size)
 
+    for line, x, y in _layout_lines(lines, font_size, _cv2_text_width, x1, y1, width, height):
+        # putText 기준점은 베이스라인 좌하단
+        (_, text_height), _ = cv2.getTextSize(line, CV2_FONT, scale, thickness)
+        origin = (int(x), int(y + text_height))
+        cv2.putText(image, line, origin, CV2_FONT, scale, (0, 0, 0), thickness, cv2.LINE_AA)
 
-def render_translations(
+
+def render_translations_np(
     image: np.ndarray,
     regions: list[TextRegion],
     translations: list[TranslationResult],
-) -> Image.Image:
-    """번역 텍스트를 이미지에 렌더링"""
+) -> np.ndarray:
+    """번역 텍스트를 이미지에 렌더링 (BGR 입력 → BGR 출력, 입력은 변경하지 않음)
+
+    ASCII 텍스트는 numpy 배열에 cv2로 직접 그린다.
+    그 외(한글 등 Hershey 폰트 미지원 문자)가 있을 때만 PIL로 변환해 FreeType으로 그린다.
+    """
     if image.size == 0:
         raise RenderingError("유효하지 않은 이미지입니다")
 
-    pil_image = Image.fromarray(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
-    draw = ImageDraw.Draw(pil_image)
+    canvas = image.copy()
     trans_map = {t.index: t.translated for t in translations}
+    pil_pending: list[tuple[str, tuple[int, int, int, int]]] = []
 
     for region in regions:
         text = trans_map.get(region.index, "")
         if not text or region.render_bbox is None:
             continue
 
-        x1, y1, x2, y2 = region.render_bbox.to_tuple()
-        _render_text_in_box(draw, text, x1, y1, x2, y2)
+        box = region.render_bbox.to_tuple()
+        if text.isascii():
+            _render_text_in_box_cv2(canvas, text, *box)
+        else:
+            pil_pending.append((text, box))
+
+    if pil_pending:
+        pil_image = Image.fromarray(cv2.cvtColor(canvas, cv2.COLOR_BGR2RGB))
+        draw = ImageDraw.Draw(pil_image)
+        for text, box in pil_pending:
+            _render_text_in_box(draw, text, *box)
+        canvas = cv2.cvtColor(np.asarray(pil_image), cv2.COLOR_RGB2BGR)
 
     logger.info(f"렌더링 완료: {len(regions)}개 영역")
-    return pil_image
+    return canvas
+
+
+def render_translations(
+    image: np.ndarray,
+    regions: list[TextRegion],
+    translations: list[TranslationResult],
+) -> Image.Image:
+    """번역 텍스트를 이미지에 렌더링 (PIL Image 반환, render_translations_np 래퍼)"""
+    result = render_translations_np(image, regions, translations)
+    return Image.fromarray(cv2.cvtColor(result, cv2.COLOR_BGR2RGB))
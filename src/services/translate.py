@@ -3,17 +3,17 @@
 비즈니스 로직만 담당. Task 호출은 route에서 처리.
 """
 
-import json
-import uuid
-from datetime import UTC, datetime
+import secrets
 from typing import Literal, cast
 
 from pydantic import BaseModel
 
 from src.constants import TTL, RedisPrefix, TranslateId
-from src.infra.redis import get_redis
+from src.infra.redis import get_redis, update_json_fields
 from src.schemas.base import BaseSchema
+from src.services.quota import check_and_consume_quota
 from src.services.upload import get_upload
+from src.utils import utc_now_iso
 
 TranslateStatus = Literal["pending", "processing", "completed", "failed"]
 
@@ -57,15 +57,7 @@ class TranslateResponse(BaseSchema):
 
 
 # --- 수정 기능 스키마 (TODO: 구현 예정) ---
-
-
-class EraseRequest(BaseSchema):
-    """영역 지우기 요청
-
-    브러시로 마킹한 영역을 LaMa inpainting으로 제거.
-    """
-
-    mask_image: str  # base64 PNG
+# 영역 지우기(EraseRequest)는 src/services/erase.py에 구현됨
 
 
 class FixRequest(BaseSchema):
@@ -92,7 +84,7 @@ class TranslateNotFoundError(Exception):
 
 
 def _generate_translate_id() -> str:
-    return f"{TranslateId.PREFIX}{uuid.uuid4().hex[:8]}"
+    return f"{TranslateId.PREFIX}{secrets.token_hex(4)}"
 
 
 async def validate_upload_id(upload_id: str) -> str:
@@ -113,31 +105,36 @@ async def update_translate_status(
     Raises:
         TranslateNotFoundError: 존재하지 않는 번역 ID
     """
-    redis = get_redis()
     key = f"{RedisPrefix.TRANSLATE}:{translate_id}"
 
-    data = redis.get(key)
-    if data is None:
-        raise TranslateNotFoundError(translate_id)
-
-    metadata = TranslateMetadata.model_validate(json.loads(cast(str, data)))
-    metadata.status = status
+    fields: dict[str, str] = {"status": status}
 
     if error_message is not None:
-        metadata.error_message = error_message
+        fields["error_message"] = error_message
 
     if status == "completed":
-        metadata.completed_at = datetime.now(UTC).isoformat().replace("+00:00", "Z")
+        fields["completed_at"] = utc_now_iso()
+
+    if not update_json_fields(key, fields):
+        raise TranslateNotFoundError(translate_id)
+
 
-    redis.set(key, metadata.model_dump_json(), keepttl=True)
+async def create_translate(
+    request: TranslateRequest,
+    original_url: str,
+    hashed_ip: str | None = None,
+) -> TranslateResponse:
+    """번역 작업 생성 (메타데이터만, 검증/task 호출은 route에서)
 
+    hashed_ip가 주어지면 쿼터 1장 차감과 메타데이터 저장을 한 번의 Lua 호출로 수행.
 
-async def create_translate(request: TranslateRequest, original_url: str) -> TranslateResponse:
-    """번역 작업 생성 (메타데이터만, 검증/쿼터/task 호출은 route에서)"""
+    Raises:
+        QuotaExceededError: hashed_ip가 주어졌고 주간 쿼터 초과 시 (메타데이터 저장 안 됨)
+    """
     redis = get_redis()
 
     translate_id = _generate_translate_id()
-    created_at = datetime.now(UTC).isoformat().replace("+00:00", "Z")
+    created_at = utc_now_iso()
 
     metadata = TranslateMetadata(
         translate_id=translate_id,
@@ -149,11 +146,11 @@ async def create_translate(request: TranslateRequest, original_url: str) -> Tran
         created_at=created_at,
     )
 
-    redis.set(
-        f"{RedisPrefix.TRANSLATE}:{translate_id}",
-        metadata.model_dump_json(),
-        ex=TTL.DATA,
-    )
+    key = f"{RedisPrefix.TRANSLATE}:{translate_id}"
+    if hashed_ip is None:
+        redis.set(key, metadata.model_dump_json(), ex=TTL.DATA)
+    else:
+        await check_and_consume_quota(hashed_ip, 1, {key: metadata.model_dump_json()}, TTL.DATA)
 
     return TranslateResponse(
         translate_id=metadata.translate_id,
@@ -174,17 +171,5 @@ async def get_translate(translate_id: str) -> TranslateResponse | None:
     if data is None:
         return None
 
-    metadata = TranslateMetadata.model_validate(json.loads(cast(str, data)))
-
-    return TranslateResponse(
-        translate_id=metadata.translate_id,
-        status=metadata.status,
-        upload_id=metadata.upload_id,
-        source_language=metadata.source_language,
-        target_language=metadata.target_language,
-        original_url=metadata.original_url,
-        result_url=metadata.result_url,
-        created_at=metadata.created_at,
-        completed_at=metadata.completed_at,
-        error_message=metadata.error_message,
-    )
+    # 저장된 메타데이터 필드는 TranslateResponse 필드와 동일 → 한 번의 검증으로 응답 생성
+    return TranslateResponse.model_validate_json(cast(str, data))
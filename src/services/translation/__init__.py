@@ -12,7 +12,6 @@
 
 from src.config import get_settings
 from src.services.translation.base import TranslationError, Translator
-from src.services.translation.gemini import GeminiTranslation
 
 __all__ = ["Translator", "TranslationError", "get_translation", "set_translation"]
 
@@ -25,6 +24,9 @@ def get_translation() -> Translator:
     if _translator is None:
         settings = get_settings()
         if settings.translation_provider == "gemini":
+            # google.genai import가 무거우므로 (~0.4s) 실제로 선택될 때만 로드
+            from src.services.translation.gemini import GeminiTranslation
+
             _translator = GeminiTranslation(
                 api_key=settings.gemini_api_key,
                 model=settings.gemini_model,
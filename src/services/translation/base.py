@@ -5,6 +5,8 @@
 
 from typing import Protocol
 
+import numpy as np
+
 from src.schemas.pipeline import BBox, TranslationResult
 
 
@@ -19,11 +21,11 @@ class Translator(Protocol):
     - GeminiTranslation: Google Gemini API
     """
 
-    def translate(self, image_path: str, bboxes: list[BBox]) -> list[TranslationResult]:
+    def translate(self, image: np.ndarray, bboxes: list[BBox]) -> list[TranslationResult]:
         """텍스트 영역들을 번역
 
         Args:
-            image_path: 이미지 파일 경로
+            image: 원본 이미지 (BGR numpy 배열)
             bboxes: 텍스트 영역 바운딩 박스 리스트
 
         Returns:
@@ -2,15 +2,15 @@
 
 # pyright: reportMissingTypeStubs=false
 
-import io
-import json
 import logging
 import re
 from typing import Any, cast
 
+import cv2
+import numpy as np
 from google import genai
 from google.genai import types
-from PIL import Image
+from pydantic_core import from_json
 
 from src.schemas.pipeline import BBox, TranslationResult
 from src.services.translation.base import TranslationError
@@ -36,7 +36,7 @@ class GeminiTranslation:
         self._api_key = api_key
         self._model = model
 
-    def translate(self, image_path: str, bboxes: list[BBox]) -> list[TranslationResult]:
+    def translate(self, image: np.ndarray, bboxes: list[BBox]) -> list[TranslationResult]:
         """텍스트 영역들을 한 번의 API 호출로 번역
 
         Raises:
@@ -49,7 +49,7 @@ class GeminiTranslation:
             raise TranslationError("GEMINI_API_KEY가 설정되지 않았습니다")
 
         client = genai.Client(api_key=self._api_key)
-        parts, original_indices = self._crop_to_parts(image_path, bboxes)
+        parts, original_indices = self._crop_to_parts(image, bboxes)
 
         if not parts:
             return []
@@ -58,21 +58,24 @@ class GeminiTranslation:
         return self._map_results(raw_results, original_indices)
 
     def _crop_to_parts(
-        self, image_path: str, bboxes: list[BBox]
+        self, image: np.ndarray, bboxes: list[BBox]
     ) -> tuple[list[types.Part], list[int]]:
         parts: list[types.Part] = []
         original_indices: list[int] = []
 
-        with Image.open(image_path) as image:
-            for idx, bbox in enumerate(bboxes):
-                if not bbox.is_valid():
-                    continue
+        for idx, bbox in enumerate(bboxes):
+            if not bbox.is_valid():
+                continue
 
-                cropped = image.crop(bbox.to_tuple())
-                buffer = io.BytesIO()
-                cropped.save(buffer, format="PNG")
-                parts.append(types.Part.from_bytes(data=buffer.getvalue(), mime_type="image/png"))
-                original_indices.append(idx)
+            x1, y1, x2, y2 = bbox.to_tuple()
+            cropped = image[y1:y2, x1:x2]
+            if cropped.size == 0:  # 이미지 범위 밖
+                continue
+            ok, buffer = cv2.imencode(".png", cropped)
+            if not ok:
+                continue
+            parts.append(types.Part.from_bytes(data=buffer.tobytes(), mime_type="image/png"))
+            original_indices.append(idx)
 
         return parts, original_indices
 
@@ -87,8 +90,8 @@ class GeminiTranslation:
             raise TranslationError("빈 응답")
 
         try:
-            raw_results = json.loads(response.text)
-        except json.JSONDecodeError:
+            raw_results = from_json(response.text)
+        except ValueError:
             raw_results = self._merge_json_arrays(response.text)
 
         if not isinstance(raw_results, list):
@@ -101,10 +104,10 @@ class GeminiTranslation:
         merged: list[dict[str, Any]] = []
         for match in re.finditer(r"\[.*?\]", text, re.DOTALL):
             try:
-                parsed = json.loads(match.group())
+                parsed = from_json(match.group())
                 if isinstance(parsed, list):
                     merged.extend(cast(list[dict[str, Any]], parsed))
-            except json.JSONDecodeError:
+            except ValueError:
                 continue
         if not merged:
             raise TranslationError(f"JSON 파싱 실패: {text[:200]}")
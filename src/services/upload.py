@@ -1,17 +1,18 @@
-import json
-import uuid
-from datetime import UTC, datetime
-from pathlib import Path
+import secrets
 from typing import cast
 
 from fastapi import UploadFile
 from pydantic import BaseModel
+from pydantic_core import from_json
 
 from src.config import get_settings
 from src.constants import TTL, RedisPrefix
 from src.infra.redis import get_redis
 from src.infra.storage import get_storage
 from src.schemas.base import BaseSchema
+from src.utils import utc_now_iso
+
+_BASE_URL = get_settings().base_url
 
 
 class UploadMetadata(BaseModel):
@@ -32,17 +33,21 @@ class UploadResponse(BaseSchema):
     created_at: str
 
 
+def _image_url(path: str) -> str:
+    """storage 상대 경로(original/{upload_id}{ext})가 곧 /static 하위 경로"""
+    return f"{_BASE_URL}/static/{path}"
+
+
 def _generate_upload_id() -> str:
-    return f"upload_{uuid.uuid4().hex[:8]}"
+    return f"upload_{secrets.token_hex(4)}"
 
 
 async def create_upload(file: UploadFile) -> UploadResponse:
     storage = get_storage()
     redis = get_redis()
-    settings = get_settings()
 
     upload_id = _generate_upload_id()
-    created_at = datetime.now(UTC).isoformat().replace("+00:00", "Z")
+    created_at = utc_now_iso()
 
     path = await storage.save(file, subdir="original", filename=upload_id)
 
@@ -61,12 +66,10 @@ async def create_upload(file: UploadFile) -> UploadResponse:
         storage.delete(path)
         raise
 
-    ext = Path(file.filename or "").suffix or ".jpg"
-    image_url = f"{settings.base_url}/static/original/{upload_id}{ext}"
-
-    return UploadResponse(
+    # get_upload과 동일하게 검증된 metadata로부터 재검증 없이 구성
+    return UploadResponse.model_construct(
         upload_id=upload_id,
-        image_url=image_url,
+        image_url=_image_url(path),
         filename=metadata.filename,
         content_type=metadata.content_type,
         size=metadata.size,
@@ -76,20 +79,18 @@ async def create_upload(file: UploadFile) -> UploadResponse:
 
 async def get_upload(upload_id: str) -> UploadResponse | None:
     redis = get_redis()
-    settings = get_settings()
 
     data = redis.get(f"{RedisPrefix.UPLOAD}:{upload_id}")
     if data is None:
         return None
 
-    metadata = UploadMetadata.model_validate(json.loads(cast(str, data)))
-    ext = Path(metadata.path).suffix
-
-    return UploadResponse(
-        upload_id=metadata.upload_id,
-        image_url=f"{settings.base_url}/static/original/{upload_id}{ext}",
-        filename=metadata.filename,
-        content_type=metadata.content_type,
-        size=metadata.size,
-        created_at=metadata.created_at,
+    # 저장 시 UploadMetadata로 검증된 값이므로 읽을 때는 파싱만 하고 재검증 없이 구성
+    metadata = from_json(cast(str, data))
+    return UploadResponse.model_construct(
+        upload_id=metadata["upload_id"],
+        image_url=_image_url(metadata["path"]),
+        filename=metadata["filename"],
+        content_type=metadata["content_type"],
+        size=metadata["size"],
+        created_at=metadata["created_at"],
     )
@@ -0,0 +1,12 @@
+"""공통 유틸리티 함수"""
+
+from datetime import UTC, datetime
+
+
+def utc_now_iso() -> str:
+    """현재 UTC 시각을 ISO 8601 문자열로 반환 (예: 2026-01-01T00:00:00.000000Z)
+
+    isoformat() + replace()보다 문자열 할당이 적음. 마이크로초는 항상 6자리.
+    """
+    now = datetime.now(UTC)
+    return f"{now:%Y-%m-%dT%H:%M:%S}.{now.microsecond:06d}Z"
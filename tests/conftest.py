@@ -1,7 +1,8 @@
 import base64
 import json
-import tempfile
+import shutil
 from collections.abc import Generator
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
 from typing import Protocol
@@ -23,19 +24,33 @@ class SetupTranslateFunc(Protocol):
     def __call__(self, translate_id: str, status: str = "completed") -> None: ...
 
 
-def make_test_image(width: int = 800, height: int = 1200, fmt: str = "JPEG") -> BytesIO:
-    """테스트용 실제 이미지 바이트 생성"""
+@lru_cache(maxsize=8)
+def _encode_test_image(width: int, height: int, fmt: str) -> bytes:
     img = Image.new("RGB", (width, height), color="red")
     buf = BytesIO()
     img.save(buf, format=fmt)
-    buf.seek(0)
-    return buf
+    return buf.getvalue()
+
+
+def make_test_image(width: int = 800, height: int = 1200, fmt: str = "JPEG") -> BytesIO:
+    """테스트용 실제 이미지 바이트 생성 (인코딩 결과는 크기/포맷별로 캐시, 매번 새 버퍼 반환)"""
+    return BytesIO(_encode_test_image(width, height, fmt))
+
+
+@pytest.fixture(scope="session")
+def session_upload_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    return tmp_path_factory.mktemp("uploads")
 
 
 @pytest.fixture
-def temp_upload_dir() -> Generator[Path, None, None]:
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+def temp_upload_dir(session_upload_dir: Path) -> Generator[Path, None, None]:
+    """세션 공용 업로드 디렉토리. 테스트마다 새로 만들지 않고 끝날 때 내용만 비움"""
+    yield session_upload_dir
+    for child in session_upload_dir.iterdir():
+        if child.is_dir():
+            shutil.rmtree(child)
+        else:
+            child.unlink()
 
 
 @pytest.fixture
@@ -43,21 +58,37 @@ def local_storage(temp_upload_dir: Path) -> LocalStorage:
     return LocalStorage(base_dir=temp_upload_dir, base_url="/static")
 
 
+@pytest.fixture(scope="session")
+def session_fake_redis() -> fakeredis.FakeRedis:
+    return fakeredis.FakeRedis(decode_responses=True)
+
+
 @pytest.fixture
-def fake_redis() -> Generator[fakeredis.FakeRedis, None, None]:
-    r = fakeredis.FakeRedis(decode_responses=True)
-    set_redis(r)
-    yield r
+def fake_redis(
+    session_fake_redis: fakeredis.FakeRedis,
+) -> Generator[fakeredis.FakeRedis, None, None]:
+    """세션 공용 FakeRedis. 테스트마다 새로 만들지 않고 끝날 때 flushall로 비움"""
+    set_redis(session_fake_redis)
+    yield session_fake_redis
+    session_fake_redis.flushall()  # pyright: ignore[reportUnknownMemberType]
     set_redis(None)
 
 
+@pytest.fixture(scope="session")
+def session_client() -> Generator[TestClient, None, None]:
+    """세션 전체에서 공유하는 TestClient (이벤트 루프 포털을 요청마다 새로 띄우지 않음)"""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
 @pytest.fixture
 def client(
-    temp_upload_dir: Path, fake_redis: fakeredis.FakeRedis
+    session_client: TestClient, temp_upload_dir: Path, fake_redis: fakeredis.FakeRedis
 ) -> Generator[TestClient, None, None]:
+    """테스트별 상태(fakeredis, 업로드 디렉토리)는 함수 단위로 교체"""
     storage = LocalStorage(base_dir=temp_upload_dir, base_url="http://localhost:8000/static")
     set_storage(storage)
-    yield TestClient(app)
+    yield session_client
     set_storage(None)
 
 
@@ -70,7 +101,7 @@ def upload_id(client: TestClient) -> str:
     return response.json()["uploadId"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_mask() -> str:
     """100x100 흰색 마스크 (base64)"""
     img = Image.new("L", (100, 100), color=255)
@@ -79,7 +110,7 @@ def test_mask() -> str:
     return base64.b64encode(buffer.getvalue()).decode()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_rgba_mask() -> str:
     """100x100 RGBA 마스크 (base64)"""
     img = Image.new("RGBA", (100, 100), color=(255, 255, 255, 255))
@@ -88,7 +119,7 @@ def test_rgba_mask() -> str:
     return base64.b64encode(buffer.getvalue()).decode()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_source_image() -> str:
     """100x100 RGB 소스 이미지 (base64)"""
     img = Image.new("RGB", (100, 100), color="blue")
@@ -97,6 +128,22 @@ def test_source_image() -> str:
     return base64.b64encode(buffer.getvalue()).decode()
 
 
+@lru_cache
+def _translate_record(translate_id: str, status: str) -> str:
+    """setup_translate용 번역 메타데이터 JSON (id/상태별로 1회만 직렬화)"""
+    metadata = {
+        "translate_id": translate_id,
+        "status": status,
+        "upload_id": "upload_test123",
+        "source_language": "ko",
+        "target_language": "en",
+        "created_at": "2026-01-01T00:00:00Z",
+    }
+    if status == "completed":
+        metadata["completed_at"] = "2026-01-01T00:01:00Z"
+    return json.dumps(metadata)
+
+
 @pytest.fixture
 def setup_translate(
     fake_redis: fakeredis.FakeRedis,
@@ -110,28 +157,15 @@ def setup_translate(
     """
 
     def _setup(translate_id: str, status: str = "completed") -> None:
-        metadata = {
-            "translate_id": translate_id,
-            "status": status,
-            "upload_id": "upload_test123",
-            "source_language": "ko",
-            "target_language": "en",
-            "created_at": "2026-01-01T00:00:00Z",
-        }
-        if status == "completed":
-            metadata["completed_at"] = "2026-01-01T00:01:00Z"
-
-        fake_redis.set(f"{RedisPrefix.TRANSLATE}:{translate_id}", json.dumps(metadata))
+        fake_redis.set(
+            f"{RedisPrefix.TRANSLATE}:{translate_id}", _translate_record(translate_id, status)
+        )
 
         if status == "completed":
             result_dir = temp_upload_dir / "result"
             result_dir.mkdir(parents=True, exist_ok=True)
             result_path = result_dir / f"{translate_id}_result.png"
-
-            img = Image.new("RGB", (100, 100), color="red")
-            buffer = BytesIO()
-            img.save(buffer, format="PNG")
-            result_path.write_bytes(buffer.getvalue())
+            result_path.write_bytes(_encode_test_image(100, 100, "PNG"))
 
     yield _setup
 
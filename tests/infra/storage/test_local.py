@@ -1,4 +1,6 @@
 from io import BytesIO
+from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from fastapi import HTTPException, UploadFile
@@ -7,6 +9,9 @@ from starlette.datastructures import Headers
 from src.infra.storage.local import ALLOWED_TYPES, MAX_SIZE, LocalStorage
 from tests.conftest import make_test_image
 
+# JPEG magic bytes + MAX_SIZE bytes. 모듈 로드 시 1회만 만들고 BytesIO는 복사 없이 공유
+OVERSIZED_JPEG = b"\xff\xd8\xff" + bytes(MAX_SIZE)
+
 
 def create_upload_file(
     content: bytes,
@@ -45,6 +50,14 @@ class TestLocalStorageSave:
 
         assert path.startswith("clean/")
 
+    async def test_subdir_created_once(self, local_storage: LocalStorage) -> None:
+        with patch.object(Path, "mkdir", autospec=True, side_effect=Path.mkdir) as mock_mkdir:
+            for _ in range(2):
+                file = create_upload_file(make_test_image().read(), "test.jpg", "image/jpeg")
+                await local_storage.save(file)
+
+        assert mock_mkdir.call_count == 1
+
     async def test_reject_invalid_content_type(self, local_storage: LocalStorage) -> None:
         file = create_upload_file(b"not an image", "file.txt", "text/plain")
 
@@ -64,8 +77,7 @@ class TestLocalStorageSave:
         assert "알 수 없음" in str(exc_info.value.detail)
 
     async def test_reject_oversized_file(self, local_storage: LocalStorage) -> None:
-        large_content = b"\xff\xd8\xff" + b"x" * MAX_SIZE
-        file = create_upload_file(large_content, "large.jpg", "image/jpeg")
+        file = create_upload_file(OVERSIZED_JPEG, "large.jpg", "image/jpeg")
 
         with pytest.raises(HTTPException) as exc_info:
             await local_storage.save(file)
@@ -84,6 +96,13 @@ class TestLocalStorageSave:
 
         assert path.endswith(".jpg")
 
+    async def test_extension_follows_content_type(self, local_storage: LocalStorage) -> None:
+        file = create_upload_file(make_test_image(fmt="PNG").read(), "image.jpeg", "image/png")
+
+        path = await local_storage.save(file)
+
+        assert path.endswith(".png")
+
 
 class TestLocalStorageGetUrl:
     def test_get_url(self, local_storage: LocalStorage) -> None:
@@ -152,6 +171,24 @@ class TestImageValidation:
         assert exc_info.value.status_code == 400
         assert "불일치" in str(exc_info.value.detail)
 
+    async def test_rejected_file_leaves_no_partial(self, local_storage: LocalStorage) -> None:
+        file = create_upload_file(
+            make_test_image(width=500, height=800).read(), "narrow.jpg", "image/jpeg"
+        )
+
+        with pytest.raises(HTTPException):
+            await local_storage.save(file)
+
+        assert list(local_storage.base_dir.rglob("*.*")) == []
+
+    async def test_reject_empty_file(self, local_storage: LocalStorage) -> None:
+        file = create_upload_file(b"", "empty.jpg", "image/jpeg")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await local_storage.save(file)
+
+        assert exc_info.value.status_code == 400
+
     async def test_accept_valid_image(self, local_storage: LocalStorage) -> None:
         file = create_upload_file(
             make_test_image(width=800, height=1200).read(), "valid.jpg", "image/jpeg"
@@ -0,0 +1,69 @@
+import json
+from pathlib import Path
+
+import fakeredis
+
+from src.constants import TTL
+from src.infra.storage.local import LocalStorage
+from src.infra.workers.translate_job import (
+    _start_job,  # type: ignore[reportPrivateUsage]
+    _update_status,  # type: ignore[reportPrivateUsage]
+)
+
+TRANSLATE_ID = "tr_aaaaaaaa"
+TRANSLATE_KEY = f"translate:{TRANSLATE_ID}"
+UPLOAD_ID = "upload_aaa"
+RELATIVE_PATH = "original/aaa.jpg"
+
+
+def _seed(redis: fakeredis.FakeRedis, upload: dict[str, str] | None) -> None:
+    redis.set(TRANSLATE_KEY, json.dumps({"upload_id": UPLOAD_ID, "status": "pending"}), ex=TTL.DATA)
+    if upload is not None:
+        redis.set(f"upload:{UPLOAD_ID}", json.dumps(upload))
+
+
+def _translate(redis: fakeredis.FakeRedis) -> dict[str, str]:
+    return json.loads(str(redis.get(TRANSLATE_KEY)))
+
+
+class TestStartJob:
+    def test_resolves_file_path_and_marks_processing(
+        self, fake_redis: fakeredis.FakeRedis, local_storage: LocalStorage, temp_upload_dir: Path
+    ) -> None:
+        _seed(fake_redis, {"path": RELATIVE_PATH})
+
+        assert _start_job(TRANSLATE_ID, local_storage) == str(temp_upload_dir / RELATIVE_PATH)
+        assert _translate(fake_redis)["status"] == "processing"
+
+    def test_missing_translate_returns_none(
+        self, fake_redis: fakeredis.FakeRedis, local_storage: LocalStorage
+    ) -> None:
+        assert _start_job(TRANSLATE_ID, local_storage) is None
+        assert not fake_redis.exists(TRANSLATE_KEY)
+
+    def test_missing_upload_returns_none(
+        self, fake_redis: fakeredis.FakeRedis, local_storage: LocalStorage
+    ) -> None:
+        _seed(fake_redis, None)
+
+        assert _start_job(TRANSLATE_ID, local_storage) is None
+
+
+class TestUpdateStatus:
+    def test_completed_sets_result_url_and_keeps_ttl(self, fake_redis: fakeredis.FakeRedis) -> None:
+        _seed(fake_redis, None)
+
+        _update_status(TRANSLATE_ID, "completed", result_url="http://x/static/result/a.png")
+
+        translate = _translate(fake_redis)
+        assert translate["status"] == "completed"
+        assert translate["result_url"] == "http://x/static/result/a.png"
+        assert translate["completed_at"].endswith("Z")
+        assert translate["upload_id"] == UPLOAD_ID
+        # fakeredis 타입 스텁 제한으로 int() 래핑 필요
+        assert int(fake_redis.ttl(TRANSLATE_KEY)) > 0  # type: ignore[reportArgumentType]
+
+    def test_missing_translate_is_noop(self, fake_redis: fakeredis.FakeRedis) -> None:
+        _update_status(TRANSLATE_ID, "failed", error_message="error")
+
+        assert not fake_redis.exists(TRANSLATE_KEY)
@@ -1,8 +1,10 @@
 import base64
 import io
 import json
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
+import pytest
 from fastapi.testclient import TestClient
 from PIL import Image
 
@@ -14,31 +16,116 @@ if TYPE_CHECKING:
     from tests.conftest import SetupTranslateFunc
 
 
-class TestErasePost:
-    def test_translate_not_found(self, client: TestClient, test_mask: str) -> None:
-        response = client.post(
-            "/erase",
-            json={"translateId": "tr_00000000", "maskImage": test_mask},
-        )
+# 결과 이미지 파일 없이 completed 상태만 있는 번역 메타데이터 (모듈 로드 시 1회 직렬화)
+COMPLETED_METADATA_JSON = json.dumps(
+    {
+        "translate_id": "tr_00000004",
+        "status": "completed",
+        "upload_id": "upload_test123",
+        "source_language": "ko",
+        "target_language": "en",
+        "created_at": "2026-01-01T00:00:00Z",
+        "completed_at": "2026-01-01T00:01:00Z",
+    }
+)
+
+
+Seed = Callable[["fakeredis.FakeRedis", "SetupTranslateFunc"], None]
+
+
+def _seed_nothing(redis: "fakeredis.FakeRedis", setup: "SetupTranslateFunc") -> None:
+    pass
+
+
+def _seed_pending(redis: "fakeredis.FakeRedis", setup: "SetupTranslateFunc") -> None:
+    setup("tr_00000001", status="pending")
 
-        assert response.status_code == 404
-        assert response.json()["detail"]["code"] == "TRANSLATE_NOT_FOUND"
 
-    def test_translate_not_completed(
+def _seed_completed(redis: "fakeredis.FakeRedis", setup: "SetupTranslateFunc") -> None:
+    setup("tr_00000002")
+
+
+def _seed_invalid_json(redis: "fakeredis.FakeRedis", setup: "SetupTranslateFunc") -> None:
+    redis.set(f"{RedisPrefix.TRANSLATE}:tr_00000003", "not valid json {{{")
+
+
+def _seed_without_result_image(redis: "fakeredis.FakeRedis", setup: "SetupTranslateFunc") -> None:
+    redis.set(f"{RedisPrefix.TRANSLATE}:tr_00000004", COMPLETED_METADATA_JSON)
+
+
+# (상태 준비, translate_id, 요청 필드 덮어쓰기, 기대 status, 기대 에러 code)
+ERROR_CASES = [
+    pytest.param(
+        _seed_nothing, "tr_00000000", {}, 404, "TRANSLATE_NOT_FOUND", id="translate-not-found"
+    ),
+    pytest.param(
+        _seed_pending, "tr_00000001", {}, 400, "TRANSLATE_NOT_COMPLETED", id="not-completed"
+    ),
+    # TODO: 사용자 입력 오류는 400/422가 더 적절 - INVALID_MASK_IMAGE 에러 코드 도입 검토
+    pytest.param(
+        _seed_completed,
+        "tr_00000002",
+        {"maskImage": "not-valid-base64!!!"},
+        500,
+        "INPAINTING_FAILED",
+        id="invalid-base64-mask",
+    ),
+    pytest.param(
+        _seed_invalid_json, "tr_00000003", {}, 500, "INPAINTING_FAILED", id="invalid-redis-json"
+    ),
+    pytest.param(
+        _seed_without_result_image,
+        "tr_00000004",
+        {},
+        404,
+        "RESULT_IMAGE_NOT_FOUND",
+        id="result-image-missing",
+    ),
+    pytest.param(
+        _seed_nothing,
+        "../../../etc/passwd",
+        {},
+        400,
+        "INVALID_TRANSLATE_ID",
+        id="path-traversal",
+    ),
+    pytest.param(
+        _seed_nothing, "tr_ZZZZZZZZ", {}, 400, "INVALID_TRANSLATE_ID", id="invalid-id-format"
+    ),
+    pytest.param(
+        _seed_nothing,
+        "tr_a1b2c3d4",
+        {"sourceImage": "not-valid-base64!!!"},
+        500,
+        "INPAINTING_FAILED",
+        id="invalid-source-image",
+    ),
+]
+
+
+class TestErasePost:
+    @pytest.mark.parametrize(("seed", "translate_id", "overrides", "status", "code"), ERROR_CASES)
+    def test_error(
         self,
         client: TestClient,
         test_mask: str,
+        fake_redis: "fakeredis.FakeRedis",
         setup_translate: "SetupTranslateFunc",
+        seed: Seed,
+        translate_id: str,
+        overrides: dict[str, str],
+        status: int,
+        code: str,
     ) -> None:
-        setup_translate("tr_00000001", status="pending")
+        seed(fake_redis, setup_translate)
 
         response = client.post(
             "/erase",
-            json={"translateId": "tr_00000001", "maskImage": test_mask},
+            json={"translateId": translate_id, "maskImage": test_mask, **overrides},
         )
 
-        assert response.status_code == 400
-        assert response.json()["detail"]["code"] == "TRANSLATE_NOT_COMPLETED"
+        assert response.status_code == status
+        assert response.json()["detail"]["code"] == code
 
     def test_success(
         self,
@@ -78,81 +165,6 @@ class TestErasePost:
         assert response.status_code == 200
         assert "resultImage" in response.json()
 
-    # TODO: 사용자 입력 오류는 400/422가 더 적절 - INVALID_MASK_IMAGE 에러 코드 도입 검토
-    def test_invalid_base64(
-        self,
-        client: TestClient,
-        setup_translate: "SetupTranslateFunc",
-    ) -> None:
-        setup_translate("tr_00000002")
-
-        response = client.post(
-            "/erase",
-            json={"translateId": "tr_00000002", "maskImage": "not-valid-base64!!!"},
-        )
-
-        assert response.status_code == 500
-        assert response.json()["detail"]["code"] == "INPAINTING_FAILED"
-
-    def test_invalid_redis_json(
-        self,
-        client: TestClient,
-        test_mask: str,
-        fake_redis: "fakeredis.FakeRedis",
-    ) -> None:
-        fake_redis.set(f"{RedisPrefix.TRANSLATE}:tr_00000003", "not valid json {{{")
-
-        response = client.post(
-            "/erase",
-            json={"translateId": "tr_00000003", "maskImage": test_mask},
-        )
-
-        assert response.status_code == 500
-        assert response.json()["detail"]["code"] == "INPAINTING_FAILED"
-
-    def test_result_image_missing(
-        self,
-        client: TestClient,
-        test_mask: str,
-        fake_redis: "fakeredis.FakeRedis",
-    ) -> None:
-        metadata = {
-            "translate_id": "tr_00000004",
-            "status": "completed",
-            "upload_id": "upload_test123",
-            "source_language": "ko",
-            "target_language": "en",
-            "created_at": "2026-01-01T00:00:00Z",
-            "completed_at": "2026-01-01T00:01:00Z",
-        }
-        fake_redis.set(f"{RedisPrefix.TRANSLATE}:tr_00000004", json.dumps(metadata))
-
-        response = client.post(
-            "/erase",
-            json={"translateId": "tr_00000004", "maskImage": test_mask},
-        )
-
-        assert response.status_code == 404
-        assert response.json()["detail"]["code"] == "RESULT_IMAGE_NOT_FOUND"
-
-    def test_path_traversal_blocked(self, client: TestClient, test_mask: str) -> None:
-        response = client.post(
-            "/erase",
-            json={"translateId": "../../../etc/passwd", "maskImage": test_mask},
-        )
-
-        assert response.status_code == 400
-        assert response.json()["detail"]["code"] == "INVALID_TRANSLATE_ID"
-
-    def test_invalid_translate_id_format(self, client: TestClient, test_mask: str) -> None:
-        response = client.post(
-            "/erase",
-            json={"translateId": "tr_ZZZZZZZZ", "maskImage": test_mask},
-        )
-
-        assert response.status_code == 400
-        assert response.json()["detail"]["code"] == "INVALID_TRANSLATE_ID"
-
     def test_success_with_source_image(
         self,
         client: TestClient,
@@ -198,21 +210,3 @@ class TestErasePost:
 
         assert response.status_code == 200
         assert "resultImage" in response.json()
-
-    def test_invalid_source_image(
-        self,
-        client: TestClient,
-        test_mask: str,
-        mock_inpainting: None,
-    ) -> None:
-        response = client.post(
-            "/erase",
-            json={
-                "translateId": "tr_a1b2c3d4",
-                "maskImage": test_mask,
-                "sourceImage": "not-valid-base64!!!",
-            },
-        )
-
-        assert response.status_code == 500
-        assert response.json()["detail"]["code"] == "INPAINTING_FAILED"
@@ -1,35 +1,33 @@
 from io import BytesIO
 
+import pytest
 from fastapi.testclient import TestClient
 
 from tests.conftest import make_test_image
 
 
 class TestUploadPost:
-    def test_upload_jpeg(self, client: TestClient) -> None:
+    @pytest.mark.parametrize(
+        ("filename", "fmt", "content_type"),
+        [("test.jpg", "JPEG", "image/jpeg"), ("test.png", "PNG", "image/png")],
+    )
+    def test_upload_image(
+        self, client: TestClient, filename: str, fmt: str, content_type: str
+    ) -> None:
         response = client.post(
             "/upload",
-            files={"file": ("test.jpg", make_test_image(), "image/jpeg")},
+            files={"file": (filename, make_test_image(fmt=fmt), content_type)},
         )
 
         assert response.status_code == 201
         data = response.json()
         assert data["uploadId"].startswith("upload_")
         assert len(data["uploadId"]) == 15  # "upload_" + 8 chars
-        assert data["filename"] == "test.jpg"
-        assert data["contentType"] == "image/jpeg"
-        assert "imageUrl" in data
+        assert data["filename"] == filename
+        assert data["contentType"] == content_type
+        assert data["imageUrl"].endswith(f"/static/original/{data['uploadId']}{filename[-4:]}")
         assert "createdAt" in data
 
-    def test_upload_png(self, client: TestClient) -> None:
-        response = client.post(
-            "/upload",
-            files={"file": ("test.png", make_test_image(fmt="PNG"), "image/png")},
-        )
-
-        assert response.status_code == 201
-        assert response.json()["contentType"] == "image/png"
-
     def test_reject_invalid_content_type(self, client: TestClient) -> None:
         response = client.post(
             "/upload",
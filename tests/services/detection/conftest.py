@@ -0,0 +1,13 @@
+from collections.abc import Generator
+from unittest.mock import patch
+
+import pytest
+
+HF_SPACE_MODULE = "src.services.detection.hf_space"
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _no_retry_sleep() -> Generator[None, None, None]:
+    """Detection 재시도 backoff(time.sleep)를 모듈 단위로 1회만 patch"""
+    with patch(f"{HF_SPACE_MODULE}.time.sleep"):
+        yield
@@ -1,5 +1,6 @@
 """HFSpaceDetection 구현체 테스트"""
 
+from collections.abc import Generator
 from typing import Any
 from unittest.mock import MagicMock, patch
 
@@ -7,6 +8,7 @@ import pytest
 from pydantic import ValidationError
 
 from src.services.detection.hf_space import HFSpaceDetection
+from src.services.detection.schemas import DetectionResult
 
 MOCK_API_RESPONSE = {
     "image_size": {"width": 800, "height": 1200},
@@ -16,6 +18,8 @@ MOCK_API_RESPONSE = {
     "text_confs": [0.92, 0.88],
 }
 
+EXPECTED_RESULT = DetectionResult.model_validate(MOCK_API_RESPONSE)
+
 MOCK_EMPTY_RESPONSE: dict[str, Any] = {
     "image_size": {"width": 800, "height": 1200},
     "bubbles": [],
@@ -24,77 +28,72 @@ MOCK_EMPTY_RESPONSE: dict[str, Any] = {
     "text_confs": [],
 }
 
-HF_SPACE_MODULE = "src.services.detection.hf_space"
-
-
-@patch(f"{HF_SPACE_MODULE}.handle_file", return_value="mock_file_handle")
-class TestHFSpaceDetection:
-    def setup_method(self) -> None:
-        self.detector = HFSpaceDetection(space_url="test/space", api_timeout=10)
-
-    def test_detect_returns_detection_result(self, _mock_handle: MagicMock) -> None:
-        with patch(f"{HF_SPACE_MODULE}.Client") as mock_client_cls:
-            mock_client = MagicMock()
-            mock_client.predict.return_value = MOCK_API_RESPONSE
-            mock_client_cls.return_value = mock_client
+EXPECTED_EMPTY_RESULT = DetectionResult.model_validate(MOCK_EMPTY_RESPONSE)
 
-            result = self.detector.detect("test.png")
-
-        assert result.image_size.width == 800
-        assert result.image_size.height == 1200
-        assert len(result.bubbles) == 2
-        assert len(result.texts) == 2
-        assert result.bubbles[0] == [10.0, 20.0, 200.0, 100.0]
+HF_SPACE_MODULE = "src.services.detection.hf_space"
 
-    def test_detect_empty_result(self, _mock_handle: MagicMock) -> None:
-        with patch(f"{HF_SPACE_MODULE}.Client") as mock_client_cls:
-            mock_client = MagicMock()
-            mock_client.predict.return_value = MOCK_EMPTY_RESPONSE
-            mock_client_cls.return_value = mock_client
 
-            result = self.detector.detect("test.png")
+@pytest.fixture
+def mock_client() -> Generator[MagicMock, None, None]:
+    """gradio Client / handle_file을 한 번에 patch한 mock 클라이언트"""
+    client = MagicMock()
+    with (
+        patch(f"{HF_SPACE_MODULE}.handle_file", return_value="mock_file_handle"),
+        patch(f"{HF_SPACE_MODULE}.Client", return_value=client),
+    ):
+        yield client
 
-        assert result.bubbles == []
-        assert result.texts == []
 
-    @patch(f"{HF_SPACE_MODULE}.time.sleep")
-    def test_detect_retries_on_failure(
-        self, _mock_sleep: MagicMock, _mock_handle: MagicMock
+class TestHFSpaceDetection:
+    # 상태 없는 구현체이므로 클래스 전체에서 공유 (재시도 sleep은 conftest에서 patch)
+    detector = HFSpaceDetection(space_url="test/space", api_timeout=10)
+
+    @pytest.mark.parametrize(
+        ("responses", "expected", "call_count"),
+        [
+            pytest.param([MOCK_API_RESPONSE], EXPECTED_RESULT, 1, id="success"),
+            pytest.param([MOCK_EMPTY_RESPONSE], EXPECTED_EMPTY_RESULT, 1, id="empty"),
+            pytest.param(
+                [Exception("API 일시 장애"), MOCK_API_RESPONSE], EXPECTED_RESULT, 2, id="retry"
+            ),
+        ],
+    )
+    def test_detect_returns_detection_result(
+        self,
+        mock_client: MagicMock,
+        responses: list[Any],
+        expected: DetectionResult,
+        call_count: int,
     ) -> None:
-        with patch(f"{HF_SPACE_MODULE}.Client") as mock_client_cls:
-            mock_client = MagicMock()
-            mock_client.predict.side_effect = [
-                Exception("API 일시 장애"),
-                MOCK_API_RESPONSE,
-            ]
-            mock_client_cls.return_value = mock_client
-
-            result = self.detector.detect("test.png")
-
-        assert len(result.bubbles) == 2
-        assert mock_client.predict.call_count == 2
-
-    @patch(f"{HF_SPACE_MODULE}.time.sleep")
-    def test_detect_raises_after_max_retries(
-        self, _mock_sleep: MagicMock, _mock_handle: MagicMock
+        mock_client.predict.side_effect = responses
+
+        result = self.detector.detect("test.png")
+
+        assert result == expected
+        assert mock_client.predict.call_count == call_count
+
+    @pytest.mark.parametrize(
+        ("side_effect", "error", "match", "call_count"),
+        [
+            # 1회 + 재시도 3회 모두 실패
+            pytest.param(
+                Exception("API 장애"), RuntimeError, "Detection API 호출 실패", 4, id="max-retries"
+            ),
+            # 스키마 불일치는 재시도 없이 즉시 실패
+            pytest.param([{"unexpected": "schema"}], ValidationError, None, 1, id="invalid-schema"),
+        ],
+    )
+    def test_detect_raises(
+        self,
+        mock_client: MagicMock,
+        side_effect: Any,
+        error: type[Exception],
+        match: str | None,
+        call_count: int,
     ) -> None:
-        with patch(f"{HF_SPACE_MODULE}.Client") as mock_client_cls:
-            mock_client = MagicMock()
-            mock_client.predict.side_effect = Exception("API 장애")
-            mock_client_cls.return_value = mock_client
-
-            with pytest.raises(RuntimeError, match="Detection API 호출 실패"):
-                self.detector.detect("test.png")
-
-        assert mock_client.predict.call_count == 4
-
-    def test_invalid_schema_fails_immediately(self, _mock_handle: MagicMock) -> None:
-        with patch(f"{HF_SPACE_MODULE}.Client") as mock_client_cls:
-            mock_client = MagicMock()
-            mock_client.predict.return_value = {"unexpected": "schema"}
-            mock_client_cls.return_value = mock_client
+        mock_client.predict.side_effect = side_effect
 
-            with pytest.raises(ValidationError):
-                self.detector.detect("test.png")
+        with pytest.raises(error, match=match):
+            self.detector.detect("test.png")
 
-        assert mock_client.predict.call_count == 1
+        assert mock_client.predict.call_count == call_count
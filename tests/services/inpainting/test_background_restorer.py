@@ -1,12 +1,19 @@
 """IOPaintRestorer 테스트"""
 
+from collections.abc import Generator
+from dataclasses import dataclass
+from functools import lru_cache
+from io import BytesIO
 from unittest.mock import MagicMock, patch
 
+import httpx
 import numpy as np
 import pytest
+from PIL import Image
 
 from src.schemas.pipeline import BBox, TextRegion
 from src.services.inpainting.background_restorer import IOPaintRestorer
+from src.services.inpainting.solid_fill import InpaintingError
 
 MODULE = "src.services.inpainting.background_restorer"
 
@@ -15,23 +22,49 @@ def _free_region(index: int, x1: float, y1: float, x2: float, y2: float) -> Text
     return TextRegion(index=index, text_bbox=BBox(x1=x1, y1=y1, x2=x2, y2=y2))
 
 
-def _image(w: int = 200, h: int = 200) -> np.ndarray:
-    return np.full((h, w, 3), 128, dtype=np.uint8)
+_GRAY = np.full((32, 32, 3), 128, dtype=np.uint8)
+_GRAY.setflags(write=False)
+
+
+def _image() -> np.ndarray:
+    """읽기 전용 공유 이미지 (restorer는 입력을 복사해서 쓴다)"""
+    return _GRAY
+
+
+@lru_cache
+def _fake_png() -> bytes:
+    """API 응답용 PNG (1회만 인코딩)"""
+    buf = BytesIO()
+    Image.fromarray(_image()).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+@dataclass(slots=True)
+class FakeResponse:
+    """httpx.Response 대역 (restorer가 쓰는 속성만)"""
+
+    content: bytes = b""
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+@pytest.fixture
+def httpx_post() -> Generator[MagicMock, None, None]:
+    """httpx.Client만 patch하고 client.post mock을 반환 (httpx 예외 클래스는 실제 것을 사용)"""
+    with patch(f"{MODULE}.httpx.Client") as mock_client_cls:
+        yield mock_client_cls.return_value.__enter__.return_value.post
 
 
 class TestIOPaintRestorer:
     def setup_method(self) -> None:
         self.restorer = IOPaintRestorer(space_url="http://test:7860")
 
-    @patch(f"{MODULE}.httpx")
-    def test_restore_returns_image_and_regions(self, mock_httpx: MagicMock) -> None:
-        result_image = _image()
-        mock_resp = MagicMock()
-        mock_resp.content = self._fake_png(result_image)
-        mock_httpx.Client.return_value.__enter__.return_value.post.return_value = mock_resp
+    def test_restore_returns_image_and_regions(self, httpx_post: MagicMock) -> None:
+        httpx_post.return_value = FakeResponse(content=_fake_png())
 
         image = _image()
-        region = _free_region(0, 10, 10, 90, 90)
+        region = _free_region(0, 2, 2, 14, 14)
         clean, regions = self.restorer.restore(image, [region])
 
         assert clean.shape[0] > 0
@@ -39,79 +72,47 @@ class TestIOPaintRestorer:
         assert regions[0].inpaint_bbox is not None
         assert regions[0].render_bbox is not None
 
-    @patch(f"{MODULE}.httpx")
-    def test_restore_empty_regions(self, mock_httpx: MagicMock) -> None:
+    def test_restore_empty_regions(self, httpx_post: MagicMock) -> None:
         image = _image()
         clean, regions = self.restorer.restore(image, [])
         assert np.array_equal(clean, image)
         assert regions == []
+        httpx_post.assert_not_called()
 
-    @patch(f"{MODULE}.httpx")
-    def test_restore_skips_out_of_bounds_regions(self, mock_httpx: MagicMock) -> None:
+    def test_restore_skips_out_of_bounds_regions(self, httpx_post: MagicMock) -> None:
         image = _image()
-        region = _free_region(0, 300, 300, 400, 400)
+        region = _free_region(0, 40, 40, 60, 60)
         clean, regions = self.restorer.restore(image, [region])
 
         assert np.array_equal(clean, image)
         assert regions == []
-        mock_httpx.Client.return_value.__enter__.return_value.post.assert_not_called()
-
-    @patch(f"{MODULE}.httpx")
-    def test_api_timeout_raises_inpainting_error(self, mock_httpx: MagicMock) -> None:
-        import httpx
+        httpx_post.assert_not_called()
 
-        from src.services.inpainting.solid_fill import InpaintingError
-
-        mock_httpx.Client.return_value.__enter__.return_value.post.side_effect = (
-            httpx.TimeoutException("timeout")
-        )
-        mock_httpx.TimeoutException = httpx.TimeoutException
-        mock_httpx.HTTPStatusError = httpx.HTTPStatusError
+    def test_api_timeout_raises_inpainting_error(self, httpx_post: MagicMock) -> None:
+        httpx_post.side_effect = httpx.TimeoutException("timeout")
 
         image = _image()
-        region = _free_region(0, 10, 10, 90, 90)
+        region = _free_region(0, 2, 2, 14, 14)
         with pytest.raises(InpaintingError, match="타임아웃"):
             self.restorer.restore(image, [region])
 
-    @patch(f"{MODULE}.httpx")
-    def test_api_http_error_raises_inpainting_error(self, mock_httpx: MagicMock) -> None:
-        import httpx
-
-        from src.services.inpainting.solid_fill import InpaintingError
-
-        mock_resp = MagicMock()
-        mock_resp.status_code = 500
-        mock_httpx.Client.return_value.__enter__.return_value.post.side_effect = (
-            httpx.HTTPStatusError("error", request=MagicMock(), response=mock_resp)
+    def test_api_http_error_raises_inpainting_error(self, httpx_post: MagicMock) -> None:
+        request = httpx.Request("POST", "http://test:7860/api/v1/inpaint")
+        httpx_post.side_effect = httpx.HTTPStatusError(
+            "error", request=request, response=httpx.Response(500, request=request)
         )
-        mock_httpx.TimeoutException = httpx.TimeoutException
-        mock_httpx.HTTPStatusError = httpx.HTTPStatusError
 
         image = _image()
-        region = _free_region(0, 10, 10, 90, 90)
+        region = _free_region(0, 2, 2, 14, 14)
         with pytest.raises(InpaintingError, match="API 오류"):
             self.restorer.restore(image, [region])
 
-    @patch(f"{MODULE}.httpx")
-    def test_restore_mask_delegates_to_api(self, mock_httpx: MagicMock) -> None:
-        result_image = _image(100, 100)
-        mock_resp = MagicMock()
-        mock_resp.content = self._fake_png(result_image)
-        mock_httpx.Client.return_value.__enter__.return_value.post.return_value = mock_resp
+    def test_restore_mask_delegates_to_api(self, httpx_post: MagicMock) -> None:
+        httpx_post.return_value = FakeResponse(content=_fake_png())
 
-        image = np.zeros((100, 100, 3), dtype=np.uint8)
-        mask = np.full((100, 100), 255, dtype=np.uint8)
+        image = np.zeros((32, 32, 3), dtype=np.uint8)
+        mask = np.full((32, 32), 255, dtype=np.uint8)
         result = self.restorer.restore_mask(image, mask)
 
         assert result.ndim == 3
-        mock_httpx.Client.return_value.__enter__.return_value.post.assert_called_once()
-
-    def _fake_png(self, image: np.ndarray) -> bytes:
-        from io import BytesIO
-
-        from PIL import Image
-
-        pil = Image.fromarray(image)
-        buf = BytesIO()
-        pil.save(buf, format="PNG")
-        return buf.getvalue()
+        httpx_post.assert_called_once()
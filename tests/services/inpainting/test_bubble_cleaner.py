@@ -10,12 +10,17 @@ def _bubble_region(index: int, text_bbox: BBox, bubble_bbox: BBox) -> TextRegion
     return TextRegion(index=index, text_bbox=text_bbox, bubble_bbox=bubble_bbox)
 
 
-def _white_image(w: int = 200, h: int = 200) -> np.ndarray:
-    return np.full((h, w, 3), 255, dtype=np.uint8)
+_WHITE = np.full((32, 32, 3), 255, dtype=np.uint8)
+_WHITE.setflags(write=False)
 
 
-BUBBLE = BBox(x1=20, y1=20, x2=180, y2=180)
-TEXT = BBox(x1=50, y1=50, x2=150, y2=150)
+def _white_image() -> np.ndarray:
+    """읽기 전용 공유 이미지 (cleaner는 입력을 복사해서 쓴다)"""
+    return _WHITE
+
+
+BUBBLE = BBox(x1=3, y1=3, x2=29, y2=29)
+TEXT = BBox(x1=8, y1=8, x2=24, y2=24)
 
 
 class TestSolidFillBubbleCleaner:
@@ -46,7 +51,8 @@ class TestSolidFillBubbleCleaner:
         assert result_regions == []
 
     def test_does_not_mutate_original_image(self) -> None:
-        image = _white_image()
+        # 쓰기 가능한 배열로 넘겨야 in-place 수정 여부를 검증할 수 있다
+        image = _white_image().copy()
         original = image.copy()
         region = _bubble_region(0, TEXT, BUBBLE)
         self.cleaner.clean(image, [region])
@@ -13,22 +13,31 @@ def _region(index: int, x1: float, y1: float, x2: float, y2: float) -> TextRegio
     return TextRegion(index=index, text_bbox=BBox(x1=x1, y1=y1, x2=x2, y2=y2))
 
 
+_GRAY = np.full((200, 200, 3), 128, dtype=np.uint8)
+_GRAY.setflags(write=False)
+
+
 def _image() -> np.ndarray:
-    return np.full((200, 200, 3), 128, dtype=np.uint8)
+    """읽기 전용 공유 이미지 (cleaner/restorer가 mock이라 그대로 전달만 된다)"""
+    return _GRAY
 
 
 BUBBLE = BBox(x1=0, y1=0, x2=100, y2=100)
 
 
 class TestRoutedInpainting:
+    # mock은 클래스 전체에서 1회만 만들고 테스트마다 호출 기록/반환값만 초기화
+    bubble_cleaner = MagicMock()
+    background_restorer = MagicMock()
+    inpainter = RoutedInpainting(
+        classifier=RegionClassifier(),
+        bubble_cleaner=bubble_cleaner,
+        background_restorer=background_restorer,
+    )
+
     def setup_method(self) -> None:
-        self.bubble_cleaner = MagicMock()
-        self.background_restorer = MagicMock()
-        self.inpainter = RoutedInpainting(
-            classifier=RegionClassifier(),
-            bubble_cleaner=self.bubble_cleaner,
-            background_restorer=self.background_restorer,
-        )
+        self.bubble_cleaner.reset_mock(return_value=True, side_effect=True)
+        self.background_restorer.reset_mock(return_value=True, side_effect=True)
 
     def test_delegates_bubble_regions_to_cleaner(self) -> None:
         image = _image()
@@ -110,4 +119,4 @@ class TestRoutedInpainting:
         result = self.inpainter.inpaint_mask(image, mask)
 
         self.background_restorer.restore_mask.assert_called_once_with(image, mask)
-        assert np.array_equal(result, expected)
+        assert result is expected
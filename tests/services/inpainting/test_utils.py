@@ -3,15 +3,18 @@
 # pytest.approx 타입 정의 불완전
 # pyright: reportUnknownMemberType=false
 
+import numpy as np
 import pytest
 
 from src.schemas.pipeline import BBox
 from src.services.inpainting.utils import (
     INSCRIBED_RATIO,
     calc_overlap_ratio,
+    calc_overlap_ratio_batch,
     calc_render_bbox,
     clip_to_bounds,
     find_bubble,
+    find_bubbles,
     inscribed_rect,
 )
 
@@ -42,6 +45,33 @@ class TestCalcOverlapRatio:
         assert calc_overlap_ratio(box_a, box_b) == 0.0
 
 
+OVERLAP_BOXES = [
+    BBox(x1=0, y1=0, x2=100, y2=100),
+    BBox(x1=10, y1=10, x2=50, y2=50),
+    BBox(x1=50, y1=0, x2=150, y2=100),
+    BBox(x1=100, y1=100, x2=200, y2=200),
+    BBox(x1=10, y1=10, x2=10, y2=50),
+]
+
+
+def _stack(boxes: list[BBox]) -> np.ndarray:
+    return np.array([[b.x1, b.y1, b.x2, b.y2] for b in boxes])
+
+
+class TestCalcOverlapRatioBatch:
+    def test_matches_scalar_for_all_pairs(self) -> None:
+        result = calc_overlap_ratio_batch(_stack(OVERLAP_BOXES), _stack(OVERLAP_BOXES))
+
+        expected = [[calc_overlap_ratio(a, b) for b in OVERLAP_BOXES] for a in OVERLAP_BOXES]
+        assert result.shape == (len(OVERLAP_BOXES), len(OVERLAP_BOXES))
+        assert np.allclose(result, expected)
+
+    @pytest.mark.parametrize(("n", "k"), [(0, 3), (3, 0), (0, 0)])
+    def test_empty_inputs(self, n: int, k: int) -> None:
+        result = calc_overlap_ratio_batch(np.zeros((n, 4)), np.zeros((k, 4)))
+        assert result.shape == (n, k)
+
+
 class TestClipToBounds:
     def test_within_bounds(self) -> None:
         bbox = BBox(x1=10, y1=20, x2=90, y2=80)
@@ -105,6 +135,35 @@ class TestFindBubble:
         assert result == big_bubble
 
 
+def _random_boxes(rng: np.random.Generator, n: int) -> list[BBox]:
+    xy = rng.uniform(0, 900, size=(n, 2))
+    corners = np.hstack([xy, xy + rng.uniform(10, 200, size=(n, 2))])
+    return [BBox.from_list(c) for c in corners.tolist()]
+
+
+class TestFindBubbles:
+    def test_matches_find_bubble_on_many_bubbles(self) -> None:
+        rng = np.random.default_rng(0)
+        texts = _random_boxes(rng, 50)
+        bubbles = _random_boxes(rng, 150)
+
+        result = find_bubbles(texts, bubbles)
+
+        assert result == [find_bubble(text, bubbles) for text in texts]
+        assert any(b is not None for b in result)
+
+    def test_tie_picks_first_bubble(self) -> None:
+        text = BBox(x1=10, y1=10, x2=90, y2=90)
+        first = BBox(x1=0, y1=0, x2=100, y2=100)
+        second = BBox(x1=5, y1=5, x2=95, y2=95)
+        assert find_bubbles([text], [first, second]) == [first]
+
+    def test_empty_inputs(self) -> None:
+        text = BBox(x1=0, y1=0, x2=100, y2=100)
+        assert find_bubbles([text], []) == [None]
+        assert find_bubbles([], [text]) == []
+
+
 class TestCalcRenderBbox:
     def test_with_bubble_returns_inscribed(self) -> None:
         bubble = BBox(x1=0, y1=0, x2=100, y2=100)
@@ -12,6 +12,7 @@ URLS_3 = [
     "http://example.com/bbb.jpg",
     "http://example.com/ccc.jpg",
 ]
+MAX_UPLOAD_IDS = [f"upload_{i}" for i in range(Limits.MAX_BATCH_SIZE)]
 
 
 class TestBatchRequestValidation:
@@ -20,13 +21,11 @@ class TestBatchRequestValidation:
             BatchRequest(upload_ids=[])
 
     def test_exceeds_max_batch_size_raises(self) -> None:
-        ids = [f"upload_{i}" for i in range(Limits.MAX_BATCH_SIZE + 1)]
         with pytest.raises(ValidationError, match="upload_ids"):
-            BatchRequest(upload_ids=ids)
+            BatchRequest(upload_ids=[*MAX_UPLOAD_IDS, "upload_overflow"])
 
     def test_max_batch_size_accepted(self) -> None:
-        ids = [f"upload_{i}" for i in range(Limits.MAX_BATCH_SIZE)]
-        request = BatchRequest(upload_ids=ids)
+        request = BatchRequest(upload_ids=MAX_UPLOAD_IDS)
         assert len(request.upload_ids) == Limits.MAX_BATCH_SIZE
 
 
@@ -6,44 +6,37 @@ import pytest
 from src.services.erase import EraseError, ensure_grayscale_mask
 
 
+def _frozen_mask(shape: tuple[int, ...]) -> np.ndarray:
+    mask = np.full(shape, 255, dtype=np.uint8)
+    mask.setflags(write=False)
+    return mask
+
+
+# 채널 수(0 = 2차원) → 모듈 로드 시 1회 생성한 읽기 전용 마스크
+_MASKS = {c: _frozen_mask((100, 100) if c == 0 else (100, 100, c)) for c in (0, 1, 3, 4, 5)}
+
+
 class TestEnsureGrayscaleMask:
     """ensure_grayscale_mask 분기 커버리지 테스트"""
 
     def test_2d_mask_passthrough(self) -> None:
         """(H, W) 형태는 그대로 반환"""
-        mask = np.full((100, 100), 255, dtype=np.uint8)
+        mask = _MASKS[0]
         result = ensure_grayscale_mask(mask)
 
-        assert result.shape == (100, 100)
-        assert np.array_equal(result, mask)
+        assert result is mask
 
-    def test_single_channel_mask(self) -> None:
-        """(H, W, 1) 형태는 (H, W)로 변환"""
-        mask = np.full((100, 100, 1), 255, dtype=np.uint8)
-        result = ensure_grayscale_mask(mask)
+    @pytest.mark.parametrize("channels", [1, 3, 4])
+    def test_multi_channel_mask_to_2d(self, channels: int) -> None:
+        """(H, W, 1), RGB, RGBA는 (H, W) grayscale로 변환"""
+        result = ensure_grayscale_mask(_MASKS[channels])
 
         assert result.shape == (100, 100)
         assert result[0, 0] == 255
 
-    def test_rgb_mask(self) -> None:
-        """(H, W, 3) RGB는 grayscale로 변환"""
-        mask = np.full((100, 100, 3), 255, dtype=np.uint8)
-        result = ensure_grayscale_mask(mask)
-
-        assert result.shape == (100, 100)
-
-    def test_rgba_mask(self) -> None:
-        """(H, W, 4) RGBA는 grayscale로 변환"""
-        mask = np.full((100, 100, 4), 255, dtype=np.uint8)
-        result = ensure_grayscale_mask(mask)
-
-        assert result.shape == (100, 100)
-
     def test_invalid_channel_count(self) -> None:
         """지원하지 않는 채널 수는 에러"""
-        mask = np.full((100, 100, 5), 255, dtype=np.uint8)
-
         with pytest.raises(EraseError) as exc_info:
-            ensure_grayscale_mask(mask)
+            ensure_grayscale_mask(_MASKS[5])
 
         assert exc_info.value.code == "INPAINTING_FAILED"
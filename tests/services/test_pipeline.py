@@ -1,7 +1,5 @@
 """멀티 모델 번역 파이프라인 테스트"""
 
-from pathlib import Path
-
 import numpy as np
 import pytest
 from PIL import Image
@@ -12,6 +10,7 @@ from src.services.detection.schemas import DetectionResult, ImageSize
 from src.services.inpainting import set_inpainting
 from src.services.pipeline import PipelineError, build_text_regions, translate_image
 from src.services.translation import set_translation
+from src.services.translation.base import TranslationError
 
 
 def _detection(
@@ -29,6 +28,30 @@ def _detection(
     )
 
 
+def _save_png(tmp_path_factory: pytest.TempPathFactory, color: str) -> str:
+    path = tmp_path_factory.mktemp("pipeline") / f"{color}.png"
+    Image.new("RGB", (100, 100), color).save(path)
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def white_png(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """세션당 1회만 인코딩하는 100x100 흰색 PNG 경로 (translate_image는 읽기만 함)"""
+    return _save_png(tmp_path_factory, "white")
+
+
+@pytest.fixture(scope="session")
+def red_png(tmp_path_factory: pytest.TempPathFactory) -> str:
+    return _save_png(tmp_path_factory, "red")
+
+
+@pytest.fixture(scope="session")
+def not_an_image(tmp_path_factory: pytest.TempPathFactory) -> str:
+    path = tmp_path_factory.mktemp("pipeline") / "not_an_image.txt"
+    path.write_bytes(b"not an image")
+    return str(path)
+
+
 class TestBuildTextRegions:
     def test_basic_conversion(self) -> None:
         detection = _detection(
@@ -108,15 +131,20 @@ class UnreachableInpainter:
 
 
 class UnreachableTranslator:
-    def translate(self, image_path: str, bboxes: list[BBox]) -> list[TranslationResult]:
+    def translate(self, image: np.ndarray, bboxes: list[BBox]) -> list[TranslationResult]:
         raise AssertionError("Translation이 호출되면 안 됨")
 
 
+class FailingTranslator:
+    def translate(self, image: np.ndarray, bboxes: list[BBox]) -> list[TranslationResult]:
+        raise TranslationError("빈 응답")
+
+
 class FakeTranslator:
     def __init__(self, translations: list[TranslationResult]) -> None:
         self._translations = translations
 
-    def translate(self, image_path: str, bboxes: list[BBox]) -> list[TranslationResult]:
+    def translate(self, image: np.ndarray, bboxes: list[BBox]) -> list[TranslationResult]:
         return self._translations
 
 
@@ -131,11 +159,7 @@ class TestTranslateImage:
         set_translation(None)
         set_inpainting(None)
 
-    def test_happy_path(self, tmp_path: Path) -> None:
-        img = Image.new("RGB", (100, 100), "white")
-        path = str(tmp_path / "test.png")
-        img.save(path)
-
+    def test_happy_path(self, white_png: str) -> None:
         detection = _detection(
             texts=[[10, 10, 50, 50]],
             bubbles=[[0, 0, 60, 60]],
@@ -144,32 +168,32 @@ class TestTranslateImage:
         set_inpainting(FakeInpainter())
         set_translation(FakeTranslator([TranslationResult(index=0, translated="Hello")]))
 
-        result = translate_image(path)
-
-        assert isinstance(result, Image.Image)
-        assert result.size == (100, 100)
+        result = translate_image(white_png)
 
-    def test_no_text_returns_original(self, tmp_path: Path) -> None:
-        img = Image.new("RGB", (100, 100), "red")
-        path = str(tmp_path / "test.png")
-        img.save(path)
+        assert isinstance(result, np.ndarray)
+        assert result.shape == (100, 100, 3)
 
+    def test_no_text_returns_original(self, red_png: str) -> None:
         set_detection(FakeDetector(_detection()))
         set_inpainting(UnreachableInpainter())
         set_translation(UnreachableTranslator())
 
-        result = translate_image(path)
+        result = translate_image(red_png)
 
-        assert isinstance(result, Image.Image)
-        assert result.size == (100, 100)
-
-    def test_image_load_failure_raises_pipeline_error(self, tmp_path: Path) -> None:
-        txt_path = str(tmp_path / "not_an_image.txt")
-        with open(txt_path, "w") as f:
-            f.write("not an image")
+        assert isinstance(result, np.ndarray)
+        assert result.shape == (100, 100, 3)
 
+    def test_image_load_failure_raises_pipeline_error(self, not_an_image: str) -> None:
         detection = _detection(texts=[[10, 10, 50, 50]])
         set_detection(FakeDetector(detection))
 
         with pytest.raises(PipelineError, match="이미지를 읽을 수 없음"):
-            translate_image(txt_path)
+            translate_image(not_an_image)
+
+    def test_translation_error_propagates(self, white_png: str) -> None:
+        set_detection(FakeDetector(_detection(texts=[[10, 10, 50, 50]])))
+        set_inpainting(FakeInpainter())
+        set_translation(FailingTranslator())
+
+        with pytest.raises(TranslationError, match="빈 응답"):
+            translate_image(white_png)
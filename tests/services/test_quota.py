@@ -2,32 +2,43 @@ import fakeredis
 import pytest
 
 from src.constants import Limits
-from src.services.quota import QuotaExceededError, check_and_consume_quota, hash_ip, refund_quota
+from src.services.quota import (
+    QuotaExceededError,
+    _get_quota_key,  # type: ignore[reportPrivateUsage]
+    check_and_consume_quota,
+    hash_ip,
+    refund_quota,
+)
 
 HASHED_IP_A = hash_ip("127.0.0.1")
 HASHED_IP_B = hash_ip("192.168.1.1")
 
 
 class TestCheckAndConsumeQuota:
-    async def test_first_usage_succeeds(self, fake_redis: fakeredis.FakeRedis) -> None:
-        await check_and_consume_quota(HASHED_IP_A, 1)
-
-    async def test_consume_multiple_images(self, fake_redis: fakeredis.FakeRedis) -> None:
-        await check_and_consume_quota(HASHED_IP_A, 5)
-        await check_and_consume_quota(HASHED_IP_A, 5)
-        await check_and_consume_quota(HASHED_IP_A, 10)
-
-    async def test_exceeds_weekly_limit(self, fake_redis: fakeredis.FakeRedis) -> None:
-        await check_and_consume_quota(HASHED_IP_A, Limits.WEEKLY_IMAGES)
-
-        with pytest.raises(QuotaExceededError):
-            await check_and_consume_quota(HASHED_IP_A, 1)
-
-    async def test_partial_exceed(self, fake_redis: fakeredis.FakeRedis) -> None:
-        await check_and_consume_quota(HASHED_IP_A, 15)
-
-        with pytest.raises(QuotaExceededError):
-            await check_and_consume_quota(HASHED_IP_A, 6)
+    @pytest.mark.parametrize(
+        ("consumed", "amount", "should_raise"),
+        [
+            pytest.param([], 1, False, id="first_usage"),
+            pytest.param([5, 5], 10, False, id="fills_exactly_to_limit"),
+            pytest.param([Limits.WEEKLY_IMAGES], 1, True, id="exceeds_weekly_limit"),
+            pytest.param([15], 6, True, id="partial_exceed"),
+        ],
+    )
+    async def test_consume(
+        self,
+        fake_redis: fakeredis.FakeRedis,
+        consumed: list[int],
+        amount: int,
+        should_raise: bool,
+    ) -> None:
+        for count in consumed:
+            await check_and_consume_quota(HASHED_IP_A, count)
+
+        if should_raise:
+            with pytest.raises(QuotaExceededError):
+                await check_and_consume_quota(HASHED_IP_A, amount)
+        else:
+            await check_and_consume_quota(HASHED_IP_A, amount)
 
     async def test_different_ips_independent(self, fake_redis: fakeredis.FakeRedis) -> None:
         await check_and_consume_quota(HASHED_IP_A, Limits.WEEKLY_IMAGES)
@@ -36,13 +47,30 @@ class TestCheckAndConsumeQuota:
     async def test_usage_key_has_ttl(self, fake_redis: fakeredis.FakeRedis) -> None:
         await check_and_consume_quota(HASHED_IP_A, 1)
 
+        key = _get_quota_key(HASHED_IP_A)
+        # KEYS와 TTL을 한 번의 왕복으로 조회
         # fakeredis 타입 스텁이 decode_responses=True 반환 타입을 정확히 표현하지 못함
-        keys = list(fake_redis.keys("usage:*"))  # type: ignore[reportUnknownMemberType]
-        assert len(keys) == 1  # type: ignore[reportUnknownArgumentType]
-        ttl = int(fake_redis.ttl(keys[0]))  # type: ignore[reportArgumentType]
+        pipe = fake_redis.pipeline(transaction=False)  # type: ignore[reportUnknownMemberType]
+        keys, ttl = pipe.keys("usage:*").ttl(key).execute()  # type: ignore[reportUnknownMemberType]
+        assert keys == [key]
         # 쿼터 TTL은 "다음 월요일까지 남은 초"로 동적 — 존재 여부만 검증
         assert ttl > 0
 
+    async def test_entries_saved_with_ttl(self, fake_redis: fakeredis.FakeRedis) -> None:
+        await check_and_consume_quota(HASHED_IP_A, 1, {"translate:tr_a": "{}"}, 100)
+
+        assert fake_redis.get("translate:tr_a") == "{}"
+        # fakeredis 타입 스텁 제한으로 int() 래핑 필요
+        assert 0 < int(fake_redis.ttl("translate:tr_a")) <= 100  # type: ignore[reportArgumentType]
+
+    async def test_entries_not_saved_when_exceeded(self, fake_redis: fakeredis.FakeRedis) -> None:
+        await check_and_consume_quota(HASHED_IP_A, Limits.WEEKLY_IMAGES)
+
+        with pytest.raises(QuotaExceededError):
+            await check_and_consume_quota(HASHED_IP_A, 1, {"translate:tr_a": "{}"})
+
+        assert not fake_redis.exists("translate:tr_a")
+
 
 class TestRefundQuota:
     async def test_refund_decreases_count(self, fake_redis: fakeredis.FakeRedis) -> None:
@@ -72,3 +100,18 @@ class TestCountValidation:
     async def test_refund_negative_raises(self, fake_redis: fakeredis.FakeRedis) -> None:
         with pytest.raises(ValueError):
             await refund_quota(HASHED_IP_A, -1)
+
+
+class TestHashIp:
+    def test_returns_16_hex_chars(self) -> None:
+        assert len(HASHED_IP_A) == 16
+        int(HASHED_IP_A, 16)
+
+    def test_deterministic_and_distinct(self) -> None:
+        assert hash_ip("127.0.0.1") == HASHED_IP_A
+        assert HASHED_IP_A != HASHED_IP_B
+
+    def test_repeated_ip_served_from_cache(self) -> None:
+        hits = hash_ip.cache_info().hits
+        hash_ip("127.0.0.1")
+        assert hash_ip.cache_info().hits == hits + 1
@@ -0,0 +1,63 @@
+"""텍스트 렌더링 테스트"""
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from src.schemas.pipeline import BBox, TextRegion, TranslationResult
+from src.services.rendering import RenderingError, render_translations, render_translations_np
+
+BOX = BBox(x1=10, y1=10, x2=190, y2=190)
+
+
+def _region(index: int = 0) -> TextRegion:
+    return TextRegion(index=index, text_bbox=BOX, render_bbox=BOX)
+
+
+def _white_image() -> np.ndarray:
+    return np.full((200, 200, 3), 255, dtype=np.uint8)
+
+
+class TestRenderTranslations:
+    @pytest.mark.parametrize("text", ["Hello there", "Café “quote”"])
+    def test_draws_text_inside_render_bbox(self, text: str) -> None:
+        image = _white_image()
+
+        result = render_translations(
+            image, [_region()], [TranslationResult(index=0, translated=text)]
+        )
+
+        assert isinstance(result, Image.Image)
+        arr = np.array(result)
+        assert arr.min() < 128
+        assert (arr[:10] == 255).all()
+
+    def test_does_not_mutate_input(self) -> None:
+        image = _white_image()
+
+        render_translations(image, [_region()], [TranslationResult(index=0, translated="Hi")])
+
+        assert (image == 255).all()
+
+    def test_missing_translation_skipped(self) -> None:
+        result = render_translations(_white_image(), [_region()], [])
+
+        assert (np.array(result) == 255).all()
+
+    def test_empty_image_raises(self) -> None:
+        with pytest.raises(RenderingError):
+            render_translations(np.zeros((0, 0, 3), dtype=np.uint8), [], [])
+
+
+class TestRenderTranslationsNp:
+    @pytest.mark.parametrize("text", ["Hello there", "Café “quote”"])
+    def test_returns_new_bgr_array(self, text: str) -> None:
+        image = _white_image()
+
+        result = render_translations_np(
+            image, [_region()], [TranslationResult(index=0, translated=text)]
+        )
+
+        assert result.shape == image.shape
+        assert result.min() < 128
+        assert (image == 255).all()
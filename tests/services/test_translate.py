@@ -0,0 +1,72 @@
+import fakeredis
+import pytest
+
+from src.constants import TTL, Limits
+from src.services.quota import QuotaExceededError, check_and_consume_quota, hash_ip
+from src.services.translate import (
+    TranslateNotFoundError,
+    TranslateRequest,
+    create_translate,
+    get_translate,
+    update_translate_status,
+)
+
+ORIGINAL_URL = "http://example.com/aaa.jpg"
+HASHED_IP = hash_ip("127.0.0.1")
+
+
+class TestCreateTranslate:
+    async def test_with_hashed_ip_consumes_quota(self, fake_redis: fakeredis.FakeRedis) -> None:
+        request = TranslateRequest(upload_id="upload_aaa")
+        created = await create_translate(request, ORIGINAL_URL, hashed_ip=HASHED_IP)
+
+        assert fake_redis.exists(f"translate:{created.translate_id}")
+        with pytest.raises(QuotaExceededError):
+            await check_and_consume_quota(HASHED_IP, Limits.WEEKLY_IMAGES)
+
+    async def test_quota_exceeded_saves_nothing(self, fake_redis: fakeredis.FakeRedis) -> None:
+        await check_and_consume_quota(HASHED_IP, Limits.WEEKLY_IMAGES)
+
+        with pytest.raises(QuotaExceededError):
+            await create_translate(
+                TranslateRequest(upload_id="upload_aaa"), ORIGINAL_URL, hashed_ip=HASHED_IP
+            )
+
+        keys = list(fake_redis.keys("translate:*"))  # type: ignore[reportUnknownMemberType]
+        assert keys == []
+
+
+class TestUpdateTranslateStatus:
+    async def test_updates_status_and_error_message(self, fake_redis: fakeredis.FakeRedis) -> None:
+        created = await create_translate(TranslateRequest(upload_id="upload_aaa"), ORIGINAL_URL)
+
+        await update_translate_status(created.translate_id, "failed", "GPU 메모리 부족")
+
+        result = await get_translate(created.translate_id)
+        assert result is not None
+        assert result.status == "failed"
+        assert result.error_message == "GPU 메모리 부족"
+        assert result.original_url == ORIGINAL_URL
+
+    async def test_completed_sets_completed_at(self, fake_redis: fakeredis.FakeRedis) -> None:
+        created = await create_translate(TranslateRequest(upload_id="upload_aaa"), ORIGINAL_URL)
+
+        await update_translate_status(created.translate_id, "completed")
+
+        result = await get_translate(created.translate_id)
+        assert result is not None
+        assert result.completed_at is not None
+        assert result.completed_at.endswith("Z")
+
+    async def test_keeps_ttl(self, fake_redis: fakeredis.FakeRedis) -> None:
+        created = await create_translate(TranslateRequest(upload_id="upload_aaa"), ORIGINAL_URL)
+
+        await update_translate_status(created.translate_id, "processing")
+
+        # fakeredis 타입 스텁 제한으로 int() 래핑 필요
+        ttl = int(fake_redis.ttl(f"translate:{created.translate_id}"))  # type: ignore[reportArgumentType]
+        assert 7100 < ttl <= TTL.DATA
+
+    async def test_not_found_raises(self, fake_redis: fakeredis.FakeRedis) -> None:
+        with pytest.raises(TranslateNotFoundError):
+            await update_translate_status("tr_00000000", "failed", "error")
@@ -1,13 +1,16 @@
 """Translation 팩토리 테스트"""
 
-from unittest.mock import patch
+from types import SimpleNamespace
 
+import numpy as np
 import pytest
 
 from src.schemas.pipeline import BBox, TranslationResult
 from src.services.translation import get_translation, set_translation
 from src.services.translation.gemini import GeminiTranslation
 
+UNKNOWN_PROVIDER_SETTINGS = SimpleNamespace(translation_provider="unknown")
+
 
 class TestGetTranslation:
     def setup_method(self) -> None:
@@ -35,13 +38,14 @@ class TestGetTranslation:
         translator = get_translation()
         assert isinstance(translator, GeminiTranslation)
 
-    def test_unknown_provider_raises(self) -> None:
-        with patch("src.services.translation.get_settings") as mock_settings:
-            mock_settings.return_value.translation_provider = "unknown"
-            with pytest.raises(ValueError, match="Unknown translation provider"):
-                get_translation()
+    def test_unknown_provider_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(
+            "src.services.translation.get_settings", lambda: UNKNOWN_PROVIDER_SETTINGS
+        )
+        with pytest.raises(ValueError, match="Unknown translation provider"):
+            get_translation()
 
 
 class MockTranslator:
-    def translate(self, image_path: str, bboxes: list[BBox]) -> list[TranslationResult]:
+    def translate(self, image: np.ndarray, bboxes: list[BBox]) -> list[TranslationResult]:
         return []
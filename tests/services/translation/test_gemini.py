@@ -1,7 +1,9 @@
 """GeminiTranslation 구현체 테스트"""
 
+from collections.abc import Generator
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
 from src.schemas.pipeline import BBox, TranslationResult
@@ -21,84 +23,64 @@ MIXED_BBOXES = [
     BBox(x1=200, y1=300, x2=400, y2=500),
 ]
 
+IMAGE = np.zeros((600, 600, 3), dtype=np.uint8)
+
 MOCK_RESPONSE = '[{"index": 0, "translated": "Hello"}, {"index": 1, "translated": "BOOM"}]'
 MOCK_MIXED_RESPONSE = '[{"index": 0, "translated": "First"}, {"index": 1, "translated": "Third"}]'
 
 
-@patch(f"{GEMINI_MODULE}.types")
-@patch(f"{GEMINI_MODULE}.Image")
+@pytest.fixture
+def gemini_response() -> Generator[MagicMock, None, None]:
+    """genai/types를 한 번에 patch하고 generate_content가 돌려줄 응답 mock을 반환"""
+    response = MagicMock()
+    with patch(f"{GEMINI_MODULE}.types"), patch(f"{GEMINI_MODULE}.genai") as mock_genai:
+        mock_genai.Client.return_value.models.generate_content.return_value = response
+        yield response
+
+
+@pytest.mark.usefixtures("gemini_response")
 class TestGeminiTranslation:
     def setup_method(self) -> None:
         self.translator = GeminiTranslation(api_key="test-key", model="test-model")
 
-    def test_translate_returns_results(
-        self, _mock_image: MagicMock, _mock_types: MagicMock
-    ) -> None:
-        with patch(f"{GEMINI_MODULE}.genai") as mock_genai:
-            mock_response = MagicMock()
-            mock_response.text = MOCK_RESPONSE
-            mock_genai.Client.return_value.models.generate_content.return_value = mock_response
+    def test_translate_returns_results(self, gemini_response: MagicMock) -> None:
+        gemini_response.text = MOCK_RESPONSE
 
-            results = self.translator.translate("test.png", VALID_BBOXES)
+        results = self.translator.translate(IMAGE, VALID_BBOXES)
 
         assert len(results) == 2
         assert results[0] == TranslationResult(index=0, translated="Hello")
         assert results[1] == TranslationResult(index=1, translated="BOOM")
 
-    def test_translate_empty_bboxes(self, _mock_image: MagicMock, _mock_types: MagicMock) -> None:
-        results = self.translator.translate("test.png", [])
+    def test_translate_empty_bboxes(self) -> None:
+        results = self.translator.translate(IMAGE, [])
         assert results == []
 
-    def test_translate_skips_invalid_bbox(
-        self, _mock_image: MagicMock, _mock_types: MagicMock
-    ) -> None:
-        with patch(f"{GEMINI_MODULE}.genai") as mock_genai:
-            mock_response = MagicMock()
-            mock_response.text = MOCK_MIXED_RESPONSE
-            mock_genai.Client.return_value.models.generate_content.return_value = mock_response
+    def test_translate_skips_invalid_bbox(self, gemini_response: MagicMock) -> None:
+        gemini_response.text = MOCK_MIXED_RESPONSE
 
-            results = self.translator.translate("test.png", MIXED_BBOXES)
+        results = self.translator.translate(IMAGE, MIXED_BBOXES)
 
         assert len(results) == 2
         assert results[0] == TranslationResult(index=0, translated="First")
         assert results[1] == TranslationResult(index=2, translated="Third")
 
-    def test_translate_no_api_key_raises(
-        self, _mock_image: MagicMock, _mock_types: MagicMock
-    ) -> None:
+    def test_translate_no_api_key_raises(self) -> None:
         translator = GeminiTranslation(api_key="", model="test-model")
         with pytest.raises(TranslationError):
-            translator.translate("test.png", VALID_BBOXES)
-
-    def test_translate_empty_response_raises(
-        self, _mock_image: MagicMock, _mock_types: MagicMock
-    ) -> None:
-        with patch(f"{GEMINI_MODULE}.genai") as mock_genai:
-            mock_response = MagicMock()
-            mock_response.text = None
-            mock_genai.Client.return_value.models.generate_content.return_value = mock_response
-
-            with pytest.raises(TranslationError):
-                self.translator.translate("test.png", VALID_BBOXES)
-
-    def test_translate_json_parse_failure_raises(
-        self, _mock_image: MagicMock, _mock_types: MagicMock
-    ) -> None:
-        with patch(f"{GEMINI_MODULE}.genai") as mock_genai:
-            mock_response = MagicMock()
-            mock_response.text = "not valid json {"
-            mock_genai.Client.return_value.models.generate_content.return_value = mock_response
-
-            with pytest.raises(TranslationError):
-                self.translator.translate("test.png", VALID_BBOXES)
-
-    def test_translate_non_list_response_raises(
-        self, _mock_image: MagicMock, _mock_types: MagicMock
-    ) -> None:
-        with patch(f"{GEMINI_MODULE}.genai") as mock_genai:
-            mock_response = MagicMock()
-            mock_response.text = '{"not": "a list"}'
-            mock_genai.Client.return_value.models.generate_content.return_value = mock_response
-
-            with pytest.raises(TranslationError):
-                self.translator.translate("test.png", VALID_BBOXES)
+            translator.translate(IMAGE, VALID_BBOXES)
+
+    def test_translate_empty_response_raises(self, gemini_response: MagicMock) -> None:
+        gemini_response.text = None
+        with pytest.raises(TranslationError):
+            self.translator.translate(IMAGE, VALID_BBOXES)
+
+    def test_translate_json_parse_failure_raises(self, gemini_response: MagicMock) -> None:
+        gemini_response.text = "not valid json {"
+        with pytest.raises(TranslationError):
+            self.translator.translate(IMAGE, VALID_BBOXES)
+
+    def test_translate_non_list_response_raises(self, gemini_response: MagicMock) -> None:
+        gemini_response.text = '{"not": "a list"}'
+        with pytest.raises(TranslationError):
+            self.translator.translate(IMAGE, VALID_BBOXES)
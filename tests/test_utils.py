@@ -0,0 +1,12 @@
+from datetime import datetime
+
+from src.utils import utc_now_iso
+
+
+class TestUtcNowIso:
+    def test_format(self) -> None:
+        value = utc_now_iso()
+
+        assert value.endswith("Z")
+        assert len(value) == len("2026-01-01T00:00:00.000000Z")
+        assert datetime.fromisoformat(value).utcoffset() is not None